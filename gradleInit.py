@@ -14,18 +14,30 @@ License: MIT
 """
 
 import argparse
+import bisect
+import codecs
+import copy
+import errno
+import functools
 import hashlib
+import importlib.util
 import json
+import mmap
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, Any
 
 # ============================================================================
 # Version & Constants
@@ -38,6 +50,14 @@ SELF_REPO = "https://github.com/stotz/gradleInit.git"
 SELF_REPO_SLUG = "stotz/gradleInit"  # owner/name for the GitHub API and raw URLs
 MODULES_VERSION = "main"  # Use main branch
 
+# Shallow clone of the modules repo, pinned to MODULES_VERSION unless "main";
+# the target directory is appended at download time
+_MODULES_CLONE_CMD = (
+    ['git', 'clone', '--depth', '1']
+    + (['--branch', MODULES_VERSION] if MODULES_VERSION != "main" else [])
+    + [MODULES_REPO]
+)
+
 # Platform detection
 IS_WINDOWS = sys.platform.startswith('win')
 
@@ -48,6 +68,14 @@ SCOOP_SHIMS_DIR = os.path.join(SCOOP_DIR, 'shims') if SCOOP_DIR else None
 # Default Gradle version
 DEFAULT_GRADLE_VERSION = "9.6.1"
 GRADLE_VERSIONS_URL = "https://services.gradle.org/versions/all"
+# The versions list is cached in ~/.gradleInit/cache and re-fetched after a day
+GRADLE_VERSIONS_CACHE_TTL = 24 * 3600
+
+# Compiled templates are kept in ~/.gradleInit/cache/jinja between runs;
+# GRADLEINIT_JINJA_CACHE=0 disables it (e.g. on CI). Deliberately not a
+# GRADLE_INIT_* name, those are all passed to templates as context values.
+JINJA_BYTECODE_CACHE = (os.environ.get('GRADLEINIT_JINJA_CACHE', '1').lower()
+                        not in ('0', 'false', 'no', 'off'))
 
 # Default project values for a fresh config; also used as fallbacks when an older
 # config file predates a key. Single source so version_sync can keep the literal
@@ -188,6 +216,10 @@ def check_and_install_dependencies() -> bool:
     Returns:
         True if all required dependencies are available
     """
+    # Already passed once in this process: nothing to probe again
+    if getattr(check_and_install_dependencies, '_done', False):
+        return True
+
     # Required packages: module_name -> pip_package_name
     # PyYAML is required: TEMPLATE.md front-matter uses nested structures
     # (subproject_mode, requirements, arguments) that only a real YAML parser
@@ -200,18 +232,18 @@ def check_and_install_dependencies() -> bool:
     missing_required = []
     missing_optional = []
 
+    # Probe without importing: already-imported modules are taken from
+    # sys.modules, others are located with find_spec (no module code runs)
+    modules = sys.modules
+
     # Check required
     for module_name, package_name in required.items():
-        try:
-            __import__(module_name)
-        except ImportError:
+        if module_name not in modules and importlib.util.find_spec(module_name) is None:
             missing_required.append((module_name, package_name))
 
     # Check optional
     for module_name, package_name in optional.items():
-        try:
-            __import__(module_name)
-        except ImportError:
+        if module_name not in modules and importlib.util.find_spec(module_name) is None:
             missing_optional.append((module_name, package_name))
 
     # Handle missing required packages
@@ -277,22 +309,32 @@ def check_and_install_dependencies() -> bool:
         # Only show note, don't spam on every run
         pass
 
+    check_and_install_dependencies._done = True
     return True
 
 
 # Check dependencies before importing
 check_and_install_dependencies()
 
-# Now safe to import required packages
-import toml
-import jinja2
+# Required packages (toml, jinja2, yaml) are imported at their point of use
+# (load_config, setup_jinja2_environment, _get_yaml, ...) so commands such as
+# '--help', 'templates --list' or '--version' do not pay their import cost.
+
+# PyYAML availability, probed without importing it
+HAS_YAML = importlib.util.find_spec('yaml') is not None
+_YAML = None
 
-# Optional imports
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+
+def _get_yaml():
+    """Import PyYAML on first use. Returns the module, or None if unavailable."""
+    global _YAML
+    if _YAML is None:
+        try:
+            import yaml
+            _YAML = yaml
+        except ImportError:
+            _YAML = False
+    return _YAML or None
 
 
 # ============================================================================
@@ -364,6 +406,122 @@ def write_text_lf(path: Path, content: str, encoding: str = 'utf-8') -> None:
     path.write_bytes(normalized.encode(encoding))
 
 
+def write_chunks_lf(path: Path, chunks: Iterable[str], encoding: str = 'utf-8') -> None:
+    """Streaming counterpart of write_text_lf, for rendered template output.
+
+    Chunks are written through a 64 KiB buffer as they are produced, so the
+    whole output is never held in memory. CRLF and CR become LF, including a
+    CRLF split across two chunks. If producing the chunks fails (e.g. an
+    undefined variable mid-render), the partial file is removed and the
+    error re-raised, so nothing is left behind, as with a render to a string.
+    """
+    try:
+        with open(path, 'w', encoding=encoding, newline='', buffering=1 << 16) as f:
+            pending_cr = False
+            for chunk in chunks:
+                if pending_cr:
+                    chunk = '\r' + chunk
+                pending_cr = chunk.endswith('\r')
+                if pending_cr:
+                    chunk = chunk[:-1]
+                f.write(chunk.replace('\r\n', '\n').replace('\r', '\n'))
+            if pending_cr:
+                f.write('\n')
+    except BaseException:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        raise
+
+
+def _prefetch_files(paths: Iterable[str]) -> None:
+    """Hint the kernel to read files ahead (POSIX_FADV_WILLNEED); no-op elsewhere"""
+    fadvise = getattr(os, 'posix_fadvise', None)
+    if fadvise is None:
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def copy_file_fast(source: Path, target: Path) -> None:
+    """Copy a file's bytes, permission bits and timestamps.
+
+    Uses os.copy_file_range where the platform has it, so the data stays in
+    the kernel; otherwise shutil.copyfile, which has its own sendfile/fcopyfile
+    fast paths. Mode and times are then set with one chmod and one utime
+    instead of copy2's full copystat.
+    """
+    copy_range = getattr(os, 'copy_file_range', None)
+    if copy_range is None:
+        shutil.copyfile(source, target)
+        st = os.stat(source)
+    else:
+        with open(source, 'rb') as fsrc, open(target, 'wb') as fdst:
+            st = os.fstat(fsrc.fileno())
+            try:
+                while copy_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            except OSError:
+                # Unsupported by the filesystem/kernel: plain buffered copy
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    os.chmod(target, stat.S_IMODE(st.st_mode))
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def remove_tree_in_background(path: Path) -> Optional[threading.Thread]:
+    """Delete a directory tree without making the caller wait for it.
+
+    The tree is first renamed to a unique '<name>.trash-<hex>' sibling (one
+    metadata operation), so its original name is free immediately; the
+    recursive delete then runs on a non-daemon thread, which the interpreter
+    joins before exiting, so the tree is gone once the CLI returns. Only a
+    killed process leaves the trash directory behind for remove_stale_trash()
+    to sweep.
+
+    Returns:
+        The deleting thread, or None if the tree was removed synchronously
+    """
+    trash = path.with_name(f"{path.name}.trash-{os.urandom(4).hex()}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return None
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={'ignore_errors': True},
+        daemon=False
+    )
+    thread.start()
+    return thread
+
+
+def remove_stale_trash(path: Path) -> None:
+    """Remove trash directories left over from remove_tree_in_background(path)"""
+    prefix = f"{path.name}.trash-"
+    try:
+        with os.scandir(path.parent) as it:
+            stale = [entry.path for entry in it if entry.name.startswith(prefix)]
+    except OSError:
+        return
+    for trash in stale:
+        shutil.rmtree(trash, ignore_errors=True)
+
+
 class RepositorySecurity:
     """
     Handle repository signing and verification.
@@ -775,10 +933,70 @@ def _filter_gradle_versions(data: List[dict], include_rc: bool = False,
     return versions
 
 
+def _read_gradle_versions_json(cache_file: Path) -> bytes:
+    """
+    Return the raw /versions/all JSON, from cache_file while it is fresh
+
+    A cache older than GRADLE_VERSIONS_CACHE_TTL is revalidated with
+    If-Modified-Since; a stale cache is also used when the request fails.
+    """
+    import urllib.error
+    import urllib.request
+    from email.utils import formatdate
+
+    try:
+        st = cache_file.stat()
+    except OSError:
+        st = None
+
+    if st and datetime.now().timestamp() - st.st_mtime < GRADLE_VERSIONS_CACHE_TTL:
+        return cache_file.read_bytes()
+
+    request = urllib.request.Request(GRADLE_VERSIONS_URL)
+    if st:
+        request.add_header('If-Modified-Since', formatdate(st.st_mtime, usegmt=True))
+
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            raw = response.read()
+    except urllib.error.HTTPError as e:
+        if not st:
+            raise
+        if e.code == 304:
+            os.utime(cache_file)  # Still current: restart the TTL
+        # Any other status (5xx, 429, ...): fall back to the stale cache
+        return cache_file.read_bytes()
+    except OSError:
+        if st:
+            return cache_file.read_bytes()
+        raise
+
+    # Caching is best effort. Written to a temporary file and renamed into
+    # place, so an interrupted write never leaves a truncated cache that
+    # would look fresh for a whole TTL
+    tmp = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name + '.')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp, cache_file)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+    return raw
+
+
 def fetch_gradle_versions(include_rc: bool = False, include_nightly: bool = False) -> List[str]:
     """
     Fetch available Gradle versions from services.gradle.org
 
+    The response is cached in ~/.gradleInit/cache/gradle-versions.json for
+    GRADLE_VERSIONS_CACHE_TTL seconds.
+
     Args:
         include_rc: Include release candidates
         include_nightly: Include nightly builds
@@ -787,10 +1005,17 @@ def fetch_gradle_versions(include_rc: bool = False, include_nightly: bool = Fals
         List of version strings, sorted newest first
     """
     try:
-        import urllib.request
-
-        with urllib.request.urlopen(GRADLE_VERSIONS_URL, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        cache_file = GradleInitPaths().cache_dir / 'gradle-versions.json'
+        try:
+            data = json.loads(_read_gradle_versions_json(cache_file))
+        except ValueError:
+            # Unparsable cache (e.g. from an older, interrupted write): treat
+            # it as a miss and fetch again
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+            data = json.loads(_read_gradle_versions_json(cache_file))
 
         return _filter_gradle_versions(data, include_rc=include_rc, include_nightly=include_nightly)
 
@@ -918,14 +1143,31 @@ def run_command(cmd: list, cwd: Path = None, check: bool = True,
 # Scoop Shims Support
 # ============================================================================
 
+def _to_unix_path(path: str) -> str:
+    """Convert a Windows path to the form Git Bash expects"""
+    drive, rest = os.path.splitdrive(path)
+    rest = rest.replace('\\', '/')
+    if drive[1:2] == ':':
+        # C:\path\to\file -> /c/path/to/file
+        return f"/{drive[0].lower()}{rest}"
+    # No drive letter (POSIX path or UNC share)
+    return drive.replace('\\', '/') + rest
+
+
+# Script location referenced by the shims, fixed for the process lifetime;
+# an absolute __file__ is used as-is, only a relative one is resolved
+_SCRIPT_PATH = Path(__file__) if os.path.isabs(__file__) else Path(__file__).resolve()
+_SCRIPT_PATH_UNIX = _to_unix_path(str(_SCRIPT_PATH))
+
+
 def get_scoop_shim_paths() -> Tuple[Optional[Path], Optional[Path]]:
     """Get paths to Scoop shim files if Scoop is available"""
     if not SCOOP_SHIMS_DIR:
         return None, None
 
-    shims_dir = Path(SCOOP_SHIMS_DIR)
-    if not shims_dir.exists():
+    if not os.path.isdir(SCOOP_SHIMS_DIR):
         return None, None
+    shims_dir = Path(SCOOP_SHIMS_DIR)
 
     cmd_shim = shims_dir / 'gradleInit.cmd'
     sh_shim = shims_dir / 'gradleInit'
@@ -938,7 +1180,24 @@ def are_scoop_shims_installed() -> bool:
     cmd_shim, sh_shim = get_scoop_shim_paths()
     if not cmd_shim or not sh_shim:
         return False
-    return cmd_shim.exists() and sh_shim.exists()
+    try:
+        os.stat(cmd_shim)
+        os.stat(sh_shim)
+    except OSError:
+        return False
+    return True
+
+
+def _write_shim(path: Path, content: str, mode: int) -> None:
+    """Write a shim with one os.open/os.write; content is written as-is (UTF-8)"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    data = content.encode('utf-8')
+    fd = os.open(path, flags, mode)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def install_scoop_shims() -> bool:
@@ -948,19 +1207,13 @@ def install_scoop_shims() -> bool:
         print_info("Scoop is not installed or not configured")
         return False
 
-    shims_dir = Path(SCOOP_SHIMS_DIR)
-    if not shims_dir.exists():
-        print_error(f"Scoop shims directory not found: {shims_dir}")
+    if not os.path.isdir(SCOOP_SHIMS_DIR):
+        print_error(f"Scoop shims directory not found: {SCOOP_SHIMS_DIR}")
         return False
+    shims_dir = Path(SCOOP_SHIMS_DIR)
 
-    # Get current script path
-    script_path = Path(__file__).resolve()
-
-    # Convert to Unix-style path for Git Bash compatibility
-    script_path_unix = str(script_path).replace('\\', '/')
-    if script_path_unix[1] == ':':
-        # C:\path\to\file -> /c/path/to/file
-        script_path_unix = '/' + script_path_unix[0].lower() + script_path_unix[2:]
+    script_path = _SCRIPT_PATH
+    script_path_unix = _SCRIPT_PATH_UNIX
 
     # Windows CMD shim
     cmd_shim = shims_dir / 'gradleInit.cmd'
@@ -987,13 +1240,13 @@ python3 {script_path_unix} "$@"
         print_info(f"Creating: {cmd_shim}")
         # Windows batch files are CRLF by convention; write it explicitly so the
         # result does not depend on the platform running gradleInit.
-        cmd_shim.write_bytes(cmd_content.replace('\r\n', '\n').replace('\n', '\r\n').encode('utf-8'))
+        _write_shim(cmd_shim, cmd_content.replace('\r\n', '\n').replace('\n', '\r\n'), 0o644)
 
-        # Write shell shim
+        # Write shell shim (LF), created executable
         print_info(f"Creating: {sh_shim}")
-        write_text_lf(sh_shim, sh_content)
+        _write_shim(sh_shim, sh_content.replace('\r\n', '\n'), 0o755)
 
-        # Make shell shim executable (doesn't hurt on Windows)
+        # Creation mode does not apply when overwriting an existing shim
         try:
             os.chmod(sh_shim, 0o755)
         except Exception:
@@ -1022,25 +1275,22 @@ def uninstall_scoop_shims() -> bool:
         print_error("SCOOP environment variable not set")
         return False
 
-    if not cmd_shim.exists() and not sh_shim.exists():
-        print_warning("Scoop shims are not installed")
-        return True
-
     try:
         removed = []
 
-        if cmd_shim.exists():
-            print_info(f"Removing: {cmd_shim}")
-            cmd_shim.unlink()
-            removed.append('gradleInit.cmd')
-
-        if sh_shim.exists():
-            print_info(f"Removing: {sh_shim}")
-            sh_shim.unlink()
-            removed.append('gradleInit')
+        # Unlink directly; a missing shim is simply not removed
+        for shim in (cmd_shim, sh_shim):
+            try:
+                shim.unlink()
+            except FileNotFoundError:
+                continue
+            print_info(f"Removed: {shim}")
+            removed.append(shim.name)
 
         if removed:
             print_success(f"Scoop shims uninstalled: {', '.join(removed)}")
+        else:
+            print_warning("Scoop shims are not installed")
 
         return True
 
@@ -1053,24 +1303,44 @@ def uninstall_scoop_shims() -> bool:
 # Git Availability Check
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
 def check_git_available() -> bool:
-    """Check if git is installed"""
+    """Check if git is installed (PATH lookup, no subprocess; cached)"""
+    return shutil.which('git') is not None
+
+
+@functools.lru_cache(maxsize=None)
+def get_git_version() -> Tuple[int, ...]:
+    """Installed git version as a tuple, e.g. (2, 43, 0); () if unknown"""
     try:
-        subprocess.run(['git', '--version'],
-                       capture_output=True,
-                       check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        result = subprocess.run(
+            ['git', '--version'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ()
+    match = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', result.stdout)
+    if not match:
+        return ()
+    return tuple(int(part) for part in match.groups() if part is not None)
 
 
-GIT_AVAILABLE = check_git_available()
+def git_supports_sparse_clone() -> bool:
+    """'git clone --filter=blob:none --sparse' needs git 2.27 or newer"""
+    return get_git_version() >= (2, 27)
 
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+# Serializes console output; files may be rendered from worker threads
+_OUTPUT_LOCK = threading.Lock()
+
+
 def print_header(message: str):
     """Print header message"""
     print(f"\n{'=' * 70}")
@@ -1080,22 +1350,31 @@ def print_header(message: str):
 
 def print_success(message: str):
     """Print success message"""
-    print(f"[OK] {message}")
+    with _OUTPUT_LOCK:
+        print(f"[OK] {message}")
 
 
 def print_error(message: str):
     """Print error message"""
-    print(f"[ERROR] {message}", file=sys.stderr)
+    with _OUTPUT_LOCK:
+        print(f"[ERROR] {message}", file=sys.stderr)
 
 
 def print_info(message: str):
     """Print info message"""
-    print(f"-> {message}")
+    with _OUTPUT_LOCK:
+        print(f"-> {message}")
 
 
 def print_warning(message: str):
     """Print warning message"""
-    print(f"[WARN] {message}")
+    with _OUTPUT_LOCK:
+        print(f"[WARN] {message}")
+
+
+# Pattern: github.com/user/repo(/tree/branch/subdir)?
+_GITHUB_URL_RE = re.compile(
+    r'(?:https?://)?github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/tree/[^/]+/(.+))?/?$')
 
 
 def parse_github_url(url: str) -> Optional[Tuple[str, Optional[str]]]:
@@ -1121,9 +1400,7 @@ def parse_github_url(url: str) -> Optional[Tuple[str, Optional[str]]]:
         >>> parse_github_url("https://github.com/stotz/gradleInitTemplates")
         ('https://github.com/stotz/gradleInitTemplates.git', None)
     """
-    # Pattern: github.com/user/repo(/tree/branch/subdir)?
-    pattern = r'(?:https?://)?github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/tree/[^/]+/(.+))?/?$'
-    match = re.match(pattern, url)
+    match = _GITHUB_URL_RE.match(url)
 
     if not match:
         return None
@@ -1154,29 +1431,62 @@ class GradleInitPaths:
             else:
                 self.base_dir = Path.home() / '.gradleInit'
 
-        # Subdirectories
-        self.config_file = self.base_dir / 'config'
-        self.templates_dir = self.base_dir / 'templates'
-        self.modules_dir = self.base_dir / 'modules'
-        self.cache_dir = self.base_dir / 'cache'
-
-        # Template repositories
-        self.official_templates = self.templates_dir / 'official'
-        self.custom_templates = self.templates_dir / 'custom'
-
-        # Cache subdirectories
-        self.remote_cache = self.cache_dir / 'remote'
-        self.compiled_templates = self.cache_dir / 'compiled'
-
-    def ensure_structure(self):
-        """Create directory structure if it doesn't exist"""
-        self.base_dir.mkdir(parents=True, exist_ok=True)
-        self.templates_dir.mkdir(exist_ok=True)
-        self.official_templates.mkdir(exist_ok=True)  # Create official templates dir
-        self.cache_dir.mkdir(exist_ok=True)
-        self.remote_cache.mkdir(exist_ok=True)
-        self.compiled_templates.mkdir(exist_ok=True)
-        self.custom_templates.mkdir(exist_ok=True)
+    # Subdirectories (built on first access; most commands need only a few)
+    @functools.cached_property
+    def config_file(self) -> Path:
+        return self.base_dir / 'config'
+
+    @functools.cached_property
+    def templates_dir(self) -> Path:
+        return self.base_dir / 'templates'
+
+    @functools.cached_property
+    def modules_dir(self) -> Path:
+        return self.base_dir / 'modules'
+
+    @functools.cached_property
+    def cache_dir(self) -> Path:
+        return self.base_dir / 'cache'
+
+    # Template repositories
+    @functools.cached_property
+    def official_templates(self) -> Path:
+        return self.templates_dir / 'official'
+
+    @functools.cached_property
+    def custom_templates(self) -> Path:
+        return self.templates_dir / 'custom'
+
+    # Cache subdirectories
+    @functools.cached_property
+    def remote_cache(self) -> Path:
+        return self.cache_dir / 'remote'
+
+    @functools.cached_property
+    def compiled_templates(self) -> Path:
+        return self.cache_dir / 'compiled'
+
+    def ensure_structure(self, create_config: bool = True):
+        """
+        Create directory structure if it doesn't exist
+
+        Args:
+            create_config: Also write the default config file if missing.
+                Callers that read the config through get_config() pass
+                False and let the first read create it.
+        """
+        # The version marker is written only after the tree exists, so a
+        # current marker (plus a config file, when one is wanted) means
+        # there is nothing to do.
+        self.cache_rebuilt = False
+        if (self._read_tool_version() == SCRIPT_VERSION
+                and (not create_config or self.config_file.exists())):
+            return
+
+        # makedirs creates base_dir, templates_dir and cache_dir on the way
+        for leaf in (self.official_templates, self.custom_templates,
+                     self.remote_cache, self.compiled_templates):
+            os.makedirs(leaf, exist_ok=True)
 
         # Rebuild the compiled cache when the tool version changed. mtime-based
         # validity cannot detect changes to the compilation logic itself, so a
@@ -1185,21 +1495,37 @@ class GradleInitPaths:
         self._invalidate_stale_cache()
 
         # Create default config if not exists
+        if create_config and not self.config_file.exists():
+            self._create_default_config()
+
+    def get_config(self) -> Dict[str, Any]:
+        """Load the config file, writing the default config on first use"""
         if not self.config_file.exists():
             self._create_default_config()
+        return load_config(self.config_file)
+
+    def _read_tool_version(self) -> Optional[str]:
+        """Version stamp of the gradleInit that last set up this tree, if any"""
+        try:
+            return (self.cache_dir / '.tool_version').read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
 
     def _invalidate_stale_cache(self):
-        """Clear the compiled template cache if gradleInit's version changed."""
+        """Clear the compiled template and Jinja2 bytecode caches if gradleInit's version changed.
+
+        The bytecode cache key does not cover environment options such as
+        trim_blocks, so entries written by another version may be wrong.
+        """
         self.cache_rebuilt = False
         marker = self.cache_dir / '.tool_version'
-        try:
-            previous = marker.read_text(encoding='utf-8').strip() if marker.exists() else None
-        except OSError:
-            previous = None
+        previous = self._read_tool_version()
         if previous == SCRIPT_VERSION:
             return
-        if self.compiled_templates.exists():
-            for child in self.compiled_templates.iterdir():
+        for cache in (self.compiled_templates, self.cache_dir / 'jinja'):
+            if not cache.exists():
+                continue
+            for child in cache.iterdir():
                 try:
                     if child.is_dir():
                         shutil.rmtree(child, ignore_errors=True)
@@ -1239,6 +1565,7 @@ class GradleInitPaths:
             }
         }
 
+        import toml
         write_text_lf(self.config_file, toml.dumps(default_config))
         print_success(f"Created default config: {self.config_file}")
 
@@ -1247,6 +1574,10 @@ class GradleInitPaths:
 # Module Loader (Optional Modules)
 # ============================================================================
 
+# 'git describe --long' output: <tag>-<commits since tag>-g<short sha>
+_GIT_DESCRIBE_LONG_RE = re.compile(r'(.+)-(\d+)-g([0-9a-f]+)\Z')
+
+
 class ModuleLoader:
     """
     Load optional modules from ~/.gradleInit/modules/
@@ -1266,6 +1597,9 @@ class ModuleLoader:
         self.spring_boot_available = False
         self.updater_available = False
 
+        # _modules_exist() result for this run; set by a successful download
+        self._modules_exist_cache: Optional[bool] = None
+
     def ensure_modules(self, auto_download: bool = True) -> bool:
         """
         Ensure modules are available
@@ -1285,7 +1619,7 @@ class ModuleLoader:
             return False
 
         # Check git availability
-        if not GIT_AVAILABLE:
+        if not check_git_available():
             print_warning("Git not available - advanced features disabled")
             print_info("Install git to enable Maven Central, Spring Boot BOM")
             return False
@@ -1310,25 +1644,32 @@ class ModuleLoader:
 
     def _show_modules_prompt(self):
         """Show user-friendly prompt for module download"""
-        print()
-        print("+-------------------------------------------------+")
-        print("| Optional Advanced Features Available            |")
-        print("+-------------------------------------------------+")
-        print("| * Maven Central integration                     |")
-        print("| * Spring Boot BOM support                       |")
-        print("| * Advanced dependency updates                   |")
-        print("|                                                 |")
-        print("| Size: ~50 KB (one-time download)                |")
-        print("+-------------------------------------------------+")
-        print()
+        sys.stdout.write(
+            "\n"
+            "+-------------------------------------------------+\n"
+            "| Optional Advanced Features Available            |\n"
+            "+-------------------------------------------------+\n"
+            "| * Maven Central integration                     |\n"
+            "| * Spring Boot BOM support                       |\n"
+            "| * Advanced dependency updates                   |\n"
+            "|                                                 |\n"
+            "| Size: ~50 KB (one-time download)                |\n"
+            "+-------------------------------------------------+\n"
+            "\n"
+        )
+        sys.stdout.flush()
 
     def _modules_exist(self) -> bool:
-        """Check if modules directory exists and is valid"""
-        return (
-                self.modules_dir.exists() and
-                (self.modules_dir / '.git').exists() and
-                (self.modules_dir / 'resolvers').exists()
-        )
+        """Check if modules directory exists and is valid (checked once per run)"""
+        if self._modules_exist_cache is None:
+            # One directory read instead of a stat per path
+            try:
+                with os.scandir(self.modules_dir) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            self._modules_exist_cache = '.git' in names and 'resolvers' in names
+        return self._modules_exist_cache
 
     def _download_modules(self) -> bool:
         """Download modules from GitHub"""
@@ -1336,12 +1677,11 @@ class ModuleLoader:
 
         try:
             # Create parent directory
-            self.modules_dir.parent.mkdir(parents=True, exist_ok=True)
+            os.makedirs(self.modules_dir.parent, exist_ok=True)
 
             # Check if directory exists but is not a valid git repo
-            if self.modules_dir.exists():
-                git_dir = self.modules_dir / '.git'
-                if not git_dir.exists():
+            if os.path.isdir(self.modules_dir):
+                if not os.path.exists(os.path.join(self.modules_dir, '.git')):
                     print_error(f"Directory exists but is not a Git repository:")
                     print_error(f"  {self.modules_dir}")
                     print()
@@ -1353,15 +1693,15 @@ class ModuleLoader:
                     return False
 
             # Clone repository
-            cmd = ['git', 'clone', '--depth', '1']
+            cmd = _MODULES_CLONE_CMD + [str(self.modules_dir)]
 
-            # Pin to specific version if not "main"
-            if MODULES_VERSION != "main":
-                cmd.extend(['--branch', MODULES_VERSION])
-
-            cmd.extend([MODULES_REPO, str(self.modules_dir)])
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Only stderr is inspected on failure; let stdout go to null
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
 
             if result.returncode != 0:
                 # Check for common error: directory already exists
@@ -1379,6 +1719,7 @@ class ModuleLoader:
                 return False
 
             print_success("Modules downloaded successfully")
+            self._modules_exist_cache = True
             return self._load_modules()
 
         except Exception as e:
@@ -1397,7 +1738,7 @@ class ModuleLoader:
             return self._load_modules()
 
         # Check git availability
-        if not GIT_AVAILABLE:
+        if not check_git_available():
             print_error("Git not available - cannot download modules")
             return False
 
@@ -1411,32 +1752,44 @@ class ModuleLoader:
             if str(self.modules_dir) not in sys.path:
                 sys.path.insert(0, str(self.modules_dir))
 
+            # Only try to import modules that are actually there; a failed
+            # import walks every sys.path entry
+            try:
+                with os.scandir(self.modules_dir / 'resolvers') as it:
+                    present = {entry.name[:-3] if entry.name.endswith('.py') else entry.name
+                               for entry in it}
+            except OSError:
+                present = set()
+
             # Try loading each module
             features_enabled = []
 
             # Maven Central
-            try:
-                import resolvers.maven_central
-                self.maven_central_available = True
-                features_enabled.append("Maven Central")
-            except ImportError:
-                pass
+            if 'maven_central' in present:
+                try:
+                    import resolvers.maven_central
+                    self.maven_central_available = True
+                    features_enabled.append("Maven Central")
+                except ImportError:
+                    pass
 
             # Spring Boot BOM
-            try:
-                import resolvers.spring_boot
-                self.spring_boot_available = True
-                features_enabled.append("Spring Boot BOM")
-            except ImportError:
-                pass
+            if 'spring_boot' in present:
+                try:
+                    import resolvers.spring_boot
+                    self.spring_boot_available = True
+                    features_enabled.append("Spring Boot BOM")
+                except ImportError:
+                    pass
 
             # Update Manager
-            try:
-                import resolvers.updater
-                self.updater_available = True
-                features_enabled.append("Update Manager")
-            except ImportError:
-                pass
+            if 'updater' in present:
+                try:
+                    import resolvers.updater
+                    self.updater_available = True
+                    features_enabled.append("Update Manager")
+                except ImportError:
+                    pass
 
             if features_enabled:
                 print_success(f"Advanced features enabled: {', '.join(features_enabled)}")
@@ -1457,9 +1810,10 @@ class ModuleLoader:
         print_info("Updating modules...")
 
         try:
-            result = subprocess.run(
+            subprocess.run(
                 ['git', '-C', str(self.modules_dir), 'pull'],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True
             )
@@ -1500,23 +1854,24 @@ class ModuleLoader:
         }
 
         try:
-            # Get current commit
+            # Commit and version from one call: --long always appends
+            # -<count>-g<short sha> when a tag is found; without tags,
+            # --always prints just the short sha
             result = subprocess.run(
-                ['git', '-C', str(self.modules_dir), 'rev-parse', '--short', 'HEAD'],
+                ['git', '-C', str(self.modules_dir), 'describe', '--tags', '--always', '--long'],
                 capture_output=True,
                 text=True,
                 check=True
             )
-            info['commit'] = result.stdout.strip()
-
-            # Get version
-            result = subprocess.run(
-                ['git', '-C', str(self.modules_dir), 'describe', '--tags', '--always'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            info['version'] = result.stdout.strip()
+            described = result.stdout.strip()
+            match = _GIT_DESCRIBE_LONG_RE.match(described)
+            if match:
+                tag, count, commit = match.groups()
+                info['commit'] = commit
+                # Same as plain 'git describe --tags --always'
+                info['version'] = tag if count == '0' else described
+            else:
+                info['commit'] = info['version'] = described
 
         except subprocess.CalledProcessError:
             pass
@@ -2035,14 +2390,17 @@ class MavenCentralStub:
         self._show_message()
 
     def _show_message(self):
-        print()
-        print("+------------------------------------------+")
-        print("| Maven Central Integration Not Available |")
-        print("+------------------------------------------+")
-        print("| To enable:                               |")
-        print("|   gradleInit modules --download       |")
-        print("+------------------------------------------+")
-        print()
+        sys.stdout.write(
+            "\n"
+            "+------------------------------------------+\n"
+            "| Maven Central Integration Not Available |\n"
+            "+------------------------------------------+\n"
+            "| To enable:                               |\n"
+            "|   gradleInit modules --download       |\n"
+            "+------------------------------------------+\n"
+            "\n"
+        )
+        sys.stdout.flush()
 
 
 class SpringBootBOMStub:
@@ -2052,36 +2410,60 @@ class SpringBootBOMStub:
         self._show_message()
 
     def _show_message(self):
-        print()
-        print("+------------------------------------------+")
-        print("| Spring Boot BOM Support Not Available   |")
-        print("+------------------------------------------+")
-        print("| To enable:                               |")
-        print("|   gradleInit modules --download       |")
-        print("+------------------------------------------+")
-        print()
+        sys.stdout.write(
+            "\n"
+            "+------------------------------------------+\n"
+            "| Spring Boot BOM Support Not Available   |\n"
+            "+------------------------------------------+\n"
+            "| To enable:                               |\n"
+            "|   gradleInit modules --download       |\n"
+            "+------------------------------------------+\n"
+            "\n"
+        )
+        sys.stdout.flush()
 
 
 # ============================================================================
 # Template Repository (Git-based)
 # ============================================================================
 
+def _has_j2_file(directory: str) -> bool:
+    """True if directory directly contains a *.j2 file (stops at the first)"""
+    try:
+        with os.scandir(directory) as it:
+            return any(entry.name.endswith('.j2') for entry in it)
+    except OSError:
+        return False
+
+
 class TemplateRepository:
     """Manage a template repository (Git-based)"""
 
     def __init__(self, name: str, path: Path, url: Optional[str] = None):
         self.name = name
         self.path = path
+        self._path_str = str(path)
         self.url = url
-        self.is_git = (path / '.git').exists()
+        # (directory mtime_ns, sorted template names) from list_templates()
+        self._list_cache: Optional[Tuple[int, List[str]]] = None
+        # get_template_path() results; cleared by clone() and update()
+        self._template_paths: Dict[str, Optional[Path]] = {}
+
+    @functools.cached_property
+    def is_git(self) -> bool:
+        """Whether the repository is a git checkout (probed on first use)"""
+        # exists(), not isdir(): .git is a file in worktrees and submodules
+        return os.path.exists(os.path.join(self._path_str, '.git'))
 
     def clone(self) -> bool:
         """Clone repository if not exists or if empty"""
+        self._template_paths.clear()
         # Check if path exists and has content
         if self.path.exists():
             # Check if directory has any templates (subdirectories)
-            has_templates = any(item.is_dir() for item in self.path.iterdir()
-                                if not item.name.startswith('.'))
+            with os.scandir(self.path) as it:
+                has_templates = any(not entry.name.startswith('.') and entry.is_dir()
+                                    for entry in it)
             if has_templates:
                 return True
             # Directory exists but is empty - remove and clone
@@ -2103,7 +2485,8 @@ class TemplateRepository:
                 if not subdir:
                     print_info(f"-> Cloning to: {self.path}")
                     run_command(
-                        ['git', 'clone', '--depth', '1', clone_url, str(self.path)],
+                        ['git', 'clone', '--depth', '1', '--single-branch',
+                         clone_url, str(self.path)],
                         verbose=True
                     )
 
@@ -2117,15 +2500,30 @@ class TemplateRepository:
 
                 # Clone to temporary directory (only if subdir specified)
                 temp_dir = self.path.parent / f"{self.path.name}_temp"
+                remove_stale_trash(temp_dir)
                 if temp_dir.exists():
                     shutil.rmtree(temp_dir, ignore_errors=True)
 
                 print_info(f"-> Cloning to temp: {temp_dir}")
                 print_info(f"-> Extracting subdir: {subdir}")
-                run_command(
-                    ['git', 'clone', '--depth', '1', clone_url, str(temp_dir)],
-                    verbose=True
-                )
+                if git_supports_sparse_clone():
+                    # Partial, sparse clone: only blobs under subdir are
+                    # downloaded and checked out
+                    run_command(
+                        ['git', 'clone', '--depth', '1', '--single-branch',
+                         '--filter=blob:none', '--sparse', clone_url, str(temp_dir)],
+                        verbose=True
+                    )
+                    run_command(
+                        ['git', '-C', str(temp_dir), 'sparse-checkout', 'set', subdir],
+                        verbose=True
+                    )
+                else:
+                    run_command(
+                        ['git', 'clone', '--depth', '1', '--single-branch',
+                         clone_url, str(temp_dir)],
+                        verbose=True
+                    )
 
                 # Move subdirectory contents to target
                 source = temp_dir / subdir
@@ -2134,16 +2532,24 @@ class TemplateRepository:
                     print_error(f"Subdirectory '{subdir}' not found in repository")
                     return False
 
-                # Move subdirectory contents to target
-                shutil.copytree(source, self.path)
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                # Move subdirectory to target: a rename on the same
+                # filesystem, a copy only across devices
+                os.makedirs(self.path.parent, exist_ok=True)
+                try:
+                    os.rename(source, self.path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.copytree(source, self.path, copy_function=shutil.copy)
+                remove_tree_in_background(temp_dir)
 
                 print_success(f"Cloned {self.name} templates")
                 return True
             else:
                 # Regular git URL - direct clone
                 subprocess.run(
-                    ['git', 'clone', '--depth', '1', self.url, str(self.path)],
+                    ['git', 'clone', '--depth', '1', '--single-branch',
+                     self.url, str(self.path)],
                     check=True,
                     capture_output=True,
                     text=True
@@ -2158,8 +2564,30 @@ class TemplateRepository:
             print_error(f"Failed to clone: {e}")
             return False
 
-    def update(self) -> bool:
-        """Update repository via git pull"""
+    def fetch(self) -> None:
+        """Fetch from the remote; raises CalledProcessError on failure"""
+        # Only the upstream branch matters: skip tags, and FETCH_HEAD
+        # (git 2.29+) since @{u} is read from the remote-tracking ref.
+        # A partial clone keeps the filter it was cloned with.
+        cmd = ['git', '-C', str(self.path), 'fetch', '--no-tags']
+        if get_git_version() >= (2, 29):
+            cmd.append('--no-write-fetch-head')
+        # stdout is never read; stderr is kept (as bytes) for the error path
+        subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+
+    def update(self, fetched: bool = False) -> bool:
+        """
+        Update repository via git pull
+
+        Args:
+            fetched: The remote was already fetched (see update_all)
+        """
+        self._template_paths.clear()
 
         # Check if directory exists first
         if not self.path.exists():
@@ -2188,40 +2616,29 @@ class TemplateRepository:
 
         try:
             # Fetch first
-            subprocess.run(
-                ['git', '-C', str(self.path), 'fetch'],
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            if not fetched:
+                self.fetch()
 
-            # Check if behind remote
-            result = subprocess.run(
-                ['git', '-C', str(self.path), 'rev-list', '--count', 'HEAD..@{u}'],
+            # Incoming commits; one line each, so the log also gives the count
+            log_result = subprocess.run(
+                ['git', '-C', str(self.path), 'log', '--oneline', 'HEAD..@{u}'],
                 capture_output=True,
                 text=True
             )
-
-            behind_count = int(result.stdout.strip() or '0')
+            commit_details = log_result.stdout.strip()
+            behind_count = commit_details.count('\n') + 1 if commit_details else 0
 
             if behind_count == 0:
                 print_success(f"{self.name} templates already up to date")
                 return True
 
-            # Get commit details before pulling
-            log_result = subprocess.run(
-                ['git', '-C', str(self.path), 'log', '--oneline', 'HEAD..@{u}'],
-                capture_output=True,
-                text=True
-            )
-            commit_details = log_result.stdout.strip()
-
-            # Pull updates
+            # Fast-forward to the commits just fetched; a pull would fetch a
+            # second time and depend on the user's pull.rebase setting
             subprocess.run(
-                ['git', '-C', str(self.path), 'pull'],
+                ['git', '-C', str(self.path), 'merge', '--ff-only', '@{u}'],
                 check=True,
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
             print_success(f"Updated {self.name} templates ({behind_count} new commits)")
@@ -2230,15 +2647,20 @@ class TemplateRepository:
             if commit_details:
                 print()
                 print_info("Changes:")
-                for line in commit_details.split('\n'):
-                    if line.strip():
-                        print(f"     {line}")
-                print()
+                # One write for the whole list, however many commits arrived
+                sys.stdout.write(''.join(
+                    f"     {line}\n" for line in commit_details.split('\n')
+                    if line.strip()
+                ) + '\n')
+                sys.stdout.flush()
 
             return True
 
         except subprocess.CalledProcessError as e:
-            stderr = e.stderr.strip() if e.stderr else str(e)
+            stderr = e.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode('utf-8', errors='replace')
+            stderr = stderr.strip() if stderr else str(e)
             print_error(f"Git command failed: {stderr}")
             print()
             print_info("This usually means templates are not a git repository.")
@@ -2256,24 +2678,55 @@ class TemplateRepository:
             return False
 
     def list_templates(self) -> List[str]:
-        """List available templates in repository"""
-        if not self.path.exists():
+        """
+        List available templates in repository
+
+        The listing is kept until the repository directory's mtime changes
+        (a template added, removed or renamed).
+        """
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
             return []
+        if self._list_cache is not None and self._list_cache[0] == mtime_ns:
+            return list(self._list_cache[1])
 
         templates = []
-        for item in self.path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                if (item / 'TEMPLATE.md').exists() or list(item.glob('*.j2')):
-                    templates.append(item.name)
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    if entry.name.startswith('.') or not entry.is_dir():
+                        continue
+                    if (os.path.exists(os.path.join(entry.path, 'TEMPLATE.md'))
+                            or _has_j2_file(entry.path)):
+                        templates.append(entry.name)
+        except OSError:
+            return []
 
-        return sorted(templates)
+        templates.sort()
+        self._list_cache = (mtime_ns, templates)
+        return list(templates)
+
+    def list_templates_with_paths(self) -> List[Tuple[str, Path]]:
+        """List available templates as (name, path) pairs.
+
+        The paths come from the same directory scan as list_templates(), so
+        no further stat is needed per template.
+        """
+        return [(name, self.path / name) for name in self.list_templates()]
 
     def get_template_path(self, template_name: str) -> Optional[Path]:
         """Get path to specific template"""
-        template_path = self.path / template_name
-        if template_path.exists() and template_path.is_dir():
-            return template_path
-        return None
+        try:
+            return self._template_paths[template_name]
+        except KeyError:
+            pass
+        # Plain string join and a single stat; remembered until the
+        # repository is cloned or updated
+        template_path = os.path.join(self._path_str, template_name)
+        result = Path(template_path) if os.path.isdir(template_path) else None
+        self._template_paths[template_name] = result
+        return result
 
 
 class TemplateRepositoryManager:
@@ -2282,6 +2735,7 @@ class TemplateRepositoryManager:
     def __init__(self, paths: GradleInitPaths):
         self.paths = paths
         self.repositories: Dict[str, TemplateRepository] = {}
+        self._index: Optional[Dict[str, Path]] = None
 
         # Register official repository
         self.repositories['official'] = TemplateRepository(
@@ -2295,17 +2749,24 @@ class TemplateRepositoryManager:
 
     def _scan_custom_repositories(self):
         """Scan custom templates directory"""
-        if not self.paths.custom_templates.exists():
+        custom_templates = self.paths.custom_templates
+        try:
+            it = os.scandir(custom_templates)
+        except OSError:
             return
 
-        for item in self.paths.custom_templates.iterdir():
-            if item.is_dir():
-                repo = TemplateRepository(
-                    f"custom/{item.name}",
-                    item,
-                    url=None
-                )
-                self.repositories[f"custom/{item.name}"] = repo
+        with it:
+            for entry in it:
+                # Skip clone leftovers: '<name>_temp' and its '.trash-<hex>' renames
+                if '.trash-' in entry.name:
+                    continue
+                if entry.is_dir():
+                    repo = TemplateRepository(
+                        f"custom/{entry.name}",
+                        custom_templates / entry.name,
+                        url=None
+                    )
+                    self.repositories[f"custom/{entry.name}"] = repo
 
     def ensure_official_templates(self) -> bool:
         """Ensure official templates are cloned"""
@@ -2313,24 +2774,56 @@ class TemplateRepositoryManager:
         # clone() now handles checking if templates exist
         return official.clone()
 
+    # Concurrent fetches in update_all; bounded to go easy on the remotes
+    FETCH_WORKERS = 4
+
     def update_all(self) -> Dict[str, bool]:
         """Update all git-based repositories"""
+        git_repos = [(name, repo) for name, repo in self.repositories.items()
+                     if repo.is_git and repo.path.exists()]
+
+        # The fetches are network-bound: run them concurrently, then update
+        # each repository in order so its output stays together. A failed
+        # fetch is retried (and reported) by update() itself.
+        fetched: Set[str] = set()
+        if len(git_repos) > 1:
+            def _fetch(item: Tuple[str, TemplateRepository]) -> Optional[str]:
+                name, repo = item
+                try:
+                    repo.fetch()
+                except (OSError, subprocess.CalledProcessError):
+                    return None
+                return name
+
+            workers = min(self.FETCH_WORKERS, len(git_repos))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fetched.update(name for name in pool.map(_fetch, git_repos) if name)
+
         results = {}
         for name, repo in self.repositories.items():
             if repo.is_git:
-                results[name] = repo.update()
+                results[name] = repo.update(fetched=name in fetched)
+        self._index = None
         return results
 
+    def _build_index(self) -> Dict[str, Path]:
+        """Map template names to paths, official repository first"""
+        index: Dict[str, Path] = {}
+        for repo in self.repositories.values():
+            for template_name, template_path in repo.list_templates_with_paths():
+                index.setdefault(template_name, template_path)
+        return index
+
     def list_all_templates(self) -> List[Dict[str, str]]:
         """List all available templates from all repositories"""
         templates = []
 
         for repo_name, repo in self.repositories.items():
-            for template_name in repo.list_templates():
+            for template_name, template_path in repo.list_templates_with_paths():
                 templates.append({
                     'name': template_name,
                     'repository': repo_name,
-                    'path': str(repo.get_template_path(template_name))
+                    'path': str(template_path)
                 })
 
         return templates
@@ -2350,19 +2843,23 @@ class TemplateRepositoryManager:
             return self._handle_template_url(template_spec)
 
         # 2. Check if it's a local path
-        path = Path(template_spec)
-        if path.exists() and path.is_dir():
-            if (path / "TEMPLATE.md").exists():
-                return path.resolve()
-
-        # 3. Try official repository
-        self.ensure_official_templates()
-        if 'official' in self.repositories:
-            tmpl_path = self.repositories['official'].get_template_path(template_spec)
-            if tmpl_path:
-                return tmpl_path
-
-        # 4. Try custom repositories
+        # (an existing <spec>/TEMPLATE.md file implies <spec> is a directory)
+        if os.path.isfile(os.path.join(template_spec, "TEMPLATE.md")):
+            return Path(template_spec).resolve()
+
+        # 3. Look up the template index (official wins on name collisions)
+        if self._index is None:
+            # Clone only when the official repository has nothing to offer
+            # yet; an existing checkout is indexed as-is (its listing is
+            # cached, so _build_index does not scan it again)
+            if not self.repositories['official'].list_templates():
+                self.ensure_official_templates()
+            self._index = self._build_index()
+        tmpl_path = self._index.get(template_spec)
+        if tmpl_path:
+            return tmpl_path
+
+        # 4. Fall back to any directory of that name, official first
         for repo in self.repositories.values():
             tmpl_path = repo.get_template_path(template_spec)
             if tmpl_path:
@@ -2373,9 +2870,24 @@ class TemplateRepositoryManager:
     def _handle_template_url(self, url: str) -> Optional[Path]:
         """Handle template from URL (GitHub or git)"""
         # Create cache directory name from URL hash
-        cache_name = hashlib.md5(url.encode()).hexdigest()[:12]
+        cache_name = hashlib.sha256(url.encode()).hexdigest()[:12]
         cache_dir = self.paths.cache_dir / cache_name
 
+        # Clones cached by older versions are keyed by an MD5 of the URL;
+        # adopt one instead of cloning again (a rename, once per URL)
+        if not cache_dir.exists():
+            try:
+                legacy_name = hashlib.md5(url.encode()).hexdigest()[:12]
+            except ValueError:
+                legacy_name = None  # MD5 unavailable (FIPS mode)
+            if legacy_name:
+                legacy_dir = self.paths.cache_dir / legacy_name
+                if (legacy_dir / "TEMPLATE.md").exists():
+                    try:
+                        os.rename(legacy_dir, cache_dir)
+                    except OSError:
+                        pass
+
         # If already cached, return it
         if cache_dir.exists() and (cache_dir / "TEMPLATE.md").exists():
             print_info("Using cached template")
@@ -2407,6 +2919,7 @@ class TemplateRepositoryManager:
 
         if repo.clone():
             self.repositories[f"custom/{name}"] = repo
+            self._index = None
             print_success(f"Added custom repository: {name}")
             return True
 
@@ -2417,7 +2930,12 @@ class TemplateRepositoryManager:
 # Template Metadata & Arguments
 # ============================================================================
 
-@dataclass
+# __slots__ for the per-variable dataclasses where supported (Python 3.10+):
+# no per-instance __dict__, faster attribute access
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TemplateArgument:
     """Template-specific CLI argument definition"""
     name: str
@@ -2429,7 +2947,7 @@ class TemplateArgument:
     required: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TemplateVariable:
     """Template variable with metadata extracted from inline hints"""
     name: str                    # Variable name (e.g., "group")
@@ -2439,6 +2957,9 @@ class TemplateVariable:
     default_value: Optional[str] = None  # Default value
     locations: List[Tuple[Path, int]] = field(default_factory=list)  # [(file, line_number), ...]
     is_enhanced: bool = False   # True if has hint, False if plain {{ var }}
+    # (regex_pattern, compiled) for validate(); recompiled if the pattern changes
+    _compiled: Optional[Tuple[str, re.Pattern]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def validate(self, value: str) -> Tuple[bool, str]:
         """
@@ -2454,8 +2975,10 @@ class TemplateVariable:
             return True, ""
 
         try:
-            pattern = re.compile(f"^{self.regex_pattern}$")
-            if pattern.match(str(value)):
+            if self._compiled is None or self._compiled[0] != self.regex_pattern:
+                self._compiled = (self.regex_pattern,
+                                  re.compile(f"^{self.regex_pattern}$"))
+            if self._compiled[1].match(str(value)):
                 return True, ""
             else:
                 return False, f"Value '{value}' does not match pattern: {self.regex_pattern}"
@@ -2509,9 +3032,36 @@ class TemplateHintParser:
         r'\s*\}\}'                      # }}
     )
 
+    # Line-local forms of the two patterns, used to scan whole files: no match
+    # can cross a line break ([^\S\r\n] for \s, no line break in the regex or
+    # help text), as when each line was scanned on its own. compile_template
+    # keeps ENHANCED_PATTERN.
+    _LINE_ENHANCED = (r'\{\{[^\S\r\n]*@@(?:(\d+)\|)?(?:\(([^)\r\n]+)\)\|)?([^@\r\n]+?)@@'
+                      r'([a-zA-Z_][a-zA-Z0-9_]*)[^\S\r\n]*\}\}')
+    _LINE_PLAIN = r'\{\{[^\S\r\n]*([a-zA-Z_][a-zA-Z0-9_]*)[^\S\r\n]*\}\}'
+    # Line breaks as read_text() sees them (universal newlines)
+    _LINE_BREAK_BYTES = re.compile(rb'\r\n?|\n')
+
+    # Both forms in one pass: groups 2-5 are the ENHANCED_PATTERN groups,
+    # group 7 the PLAIN_PATTERN variable name
+    HINT_PATTERN = re.compile(f'(?P<enhanced>{_LINE_ENHANCED})|(?P<plain>{_LINE_PLAIN})')
+
+    HINT_PATTERN_BYTES = re.compile(HINT_PATTERN.pattern.encode('ascii'))
+    # Plain variables nested in an enhanced hint's help text (found separately)
+    PLAIN_PATTERN_BYTES = re.compile(_LINE_PLAIN.encode('ascii'))
+
+    # Files at least this large are scanned through mmap instead of read()
+    MMAP_MIN_SIZE = 256 * 1024
+
     def __init__(self, template_dir: Path):
         self.template_dir = template_dir
         self.variables: Dict[str, TemplateVariable] = {}
+        # get_sorted_variables() result; reset by _add_variable
+        self._sorted_cache: Optional[List[TemplateVariable]] = None
+
+    # Files scanned concurrently by parse_templates (reading overlaps with
+    # regex work); fewer files than this are scanned inline
+    PARALLEL_MIN_FILES = 8
 
     def parse_templates(self) -> Dict[str, TemplateVariable]:
         """
@@ -2523,99 +3073,184 @@ class TemplateHintParser:
         # Find all template files
         template_files = self._find_template_files()
 
-        # Parse each file
-        for file_path in template_files:
-            self._parse_file(file_path)
+        # Scan the files (in parallel for larger templates), then merge the
+        # hits in file order so the result does not depend on scheduling.
+        # Off the main thread the caller already runs a pool (e.g. the
+        # templates listing loads metadata in parallel); scan inline there
+        # instead of nesting a pool per worker
+        if (len(template_files) >= self.PARALLEL_MIN_FILES
+                and threading.current_thread() is threading.main_thread()):
+            workers = min(32, (os.cpu_count() or 1) * 4, len(template_files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                scanned = list(pool.map(self._scan_file, template_files))
+        else:
+            scanned = [self._scan_file(file_path) for file_path in template_files]
+
+        for file_path, hits in zip(template_files, scanned):
+            self._merge_hits(file_path, hits)
 
         return self.variables
 
-    def _find_template_files(self) -> List[Path]:
-        """Find all files that could contain Jinja2 templates"""
-        extensions = [
-            '.gradle.kts', '.gradle', '.kt', '.kts',
-            '.properties', '.yml', '.yaml', '.xml',
-            '.toml', '.json', '.md', '.txt', '.sh'
-        ]
-
-        files = []
-        for ext in extensions:
-            files.extend(self.template_dir.rglob(f'*{ext}'))
-
-        # Exclude build artifacts, VCS and the Gradle cache. The 'gradle/'
-        # directory itself is scanned because gradle/libs.versions.toml carries
-        # version hints (e.g. the jdk hint); only gradle/wrapper (binaries and the
-        # generated wrapper properties) is skipped.
-        exclude_dirs = {'.git', 'build', '.gradle'}
-
-        def _is_excluded(f: Path) -> bool:
-            parts = f.parts
-            if any(ex in parts for ex in exclude_dirs):
-                return True
-            for i in range(len(parts) - 1):
-                if parts[i] == 'gradle' and parts[i + 1] == 'wrapper':
-                    return True
-            return False
+    # Scanned file types, in scan order ('.gradle.kts' before '.kts'/'.gradle')
+    TEMPLATE_EXTENSIONS = (
+        '.gradle.kts', '.gradle', '.kt', '.kts',
+        '.properties', '.yml', '.yaml', '.xml',
+        '.toml', '.json', '.md', '.txt', '.sh'
+    )
 
-        files = [f for f in files if not _is_excluded(f)]
+    # Build artifacts, VCS and the Gradle cache. The 'gradle/' directory
+    # itself is scanned because gradle/libs.versions.toml carries version
+    # hints (e.g. the jdk hint); only gradle/wrapper (binaries and the
+    # generated wrapper properties) is skipped.
+    EXCLUDE_DIRS = frozenset({'.git', 'build', '.gradle'})
 
-        return files
+    def _find_template_files(self) -> List[Path]:
+        """Find all files that could contain Jinja2 templates"""
+        # One walk, pruning excluded directories; files are grouped by
+        # extension in TEMPLATE_EXTENSIONS order (which decides the first
+        # hint seen for a variable), each file listed once
+        extensions = self.TEMPLATE_EXTENSIONS
+        buckets: List[List[Path]] = [[] for _ in extensions]
+        exclude_dirs = self.EXCLUDE_DIRS
+
+        for root, dirs, filenames in os.walk(self.template_dir):
+            dirs[:] = [d for d in dirs if d not in exclude_dirs
+                       and not (d == 'wrapper' and os.path.basename(root) == 'gradle')]
+            root_path = Path(root)
+            for filename in filenames:
+                for index, ext in enumerate(extensions):
+                    if filename.endswith(ext):
+                        buckets[index].append(root_path / filename)
+                        break
+
+        return [f for bucket in buckets for f in bucket]
 
     def _parse_file(self, file_path: Path):
         """Parse a single file for template variables"""
+        self._merge_hits(file_path, self._scan_file(file_path))
+
+    def _scan_file(self, file_path: Path) -> List[Tuple[int, bool, str, str, int,
+                                                        Optional[str], Optional[str]]]:
+        """
+        Find the hints in one file without touching self.variables
+
+        Safe to run from worker threads.
+
+        Returns:
+            (line_number, is_enhanced, var_name, help_text, sort_order,
+            regex_pattern, default_value) tuples; per line, enhanced hints
+            come before plain variables, each in order of appearance
+        """
+        # The raw bytes are matched directly (large files through mmap); only
+        # the captured groups are decoded
         try:
-            content = file_path.read_text(encoding='utf-8')
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= self.MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        return self._scan_bytes(content)
+                return self._scan_bytes(f.read())
         except (UnicodeDecodeError, PermissionError):
-            return
+            return []
 
-        lines = content.split('\n')
+    def _scan_bytes(self, content) -> List[Tuple[int, bool, str, str, int,
+                                                 Optional[str], Optional[str]]]:
+        """_scan_file() on the file's bytes (bytes or a read-only mmap)"""
+        # Every hint starts with '{{': a plain substring search (memchr-fast)
+        # rules out the many files that contain none
+        if content.find(b'{{') < 0:
+            return []
 
-        for line_num, line in enumerate(lines, 1):
-            # Try enhanced pattern first
-            for match in self.ENHANCED_PATTERN.finditer(line):
-                sort_str, regex_pattern, help_and_default, var_name = match.groups()
+        # Files that are not valid UTF-8 are skipped (UnicodeDecodeError), as
+        # with read_text(); the all-ASCII check settles most files cheaply
+        if isinstance(content, bytes):
+            if not content.isascii():
+                content.decode('utf-8')
+        else:
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            for offset in range(0, len(content), 1 << 20):
+                decoder.decode(content[offset:offset + (1 << 20)])
+            decoder.decode(b'', final=True)
+
+        # Scan the whole file once; line numbers come from the offsets of the
+        # line breaks. The patterns are line-local, so no match spans one.
+        line_starts = [0]
+        if content.find(b'\r') >= 0:
+            line_starts.extend(m.end() for m in self._LINE_BREAK_BYTES.finditer(content))
+        else:
+            pos = content.find(b'\n')
+            while pos != -1:
+                line_starts.append(pos + 1)
+                pos = content.find(b'\n', pos + 1)
+
+        # (line, kind, offset, match or plain variable name)
+        found = []
+        for match in self.HINT_PATTERN_BYTES.finditer(content):
+            start = match.start()
+            line_num = bisect.bisect_right(line_starts, start)
+            if match.group('enhanced') is None:
+                found.append((line_num, 1, start, match.group(7)))
+                continue
+            found.append((line_num, 0, start, match))
+            # A plain variable inside the help text counts too; the alternation
+            # consumed it as part of the enhanced hint
+            end = match.end()
+            if content.find(b'{{', start + 2, end) >= 0:
+                for inner in self.PLAIN_PATTERN_BYTES.finditer(content, start + 2, end):
+                    found.append((line_num, 1, inner.start(), inner.group(1)))
+        # Per line, enhanced hints are recorded before plain variables
+        found.sort(key=lambda item: item[:3])
+
+        hits = []
+        for line_num, kind, _, hit in found:
+            if kind == 0:
+                sort_str, regex_pattern, help_and_default, var_name = (
+                    group.decode('utf-8') if group is not None else None
+                    for group in hit.group(2, 3, 4, 5)
+                )
                 sort_order = int(sort_str) if sort_str else 999
 
-                # Extract help text and default value
-                help_text = help_and_default.strip()
-                default_value = None
-
-                if '=' in help_text:
-                    parts = help_text.rsplit('=', 1)  # Split from right to handle = in help text
-                    help_text = parts[0].strip()
-                    default_value = parts[1].strip() if len(parts) > 1 else None
-
-                self._add_variable(
-                    var_name=var_name,
-                    help_text=help_text,
-                    sort_order=sort_order,
-                    regex_pattern=regex_pattern,
-                    default_value=default_value,
-                    file_path=file_path,
-                    line_number=line_num,
-                    is_enhanced=True
-                )
+                # Extract help text and default value; split at the last '='
+                # so the help text itself may contain '='
+                help_text, sep, default_value = help_and_default.strip().rpartition('=')
+                if sep:
+                    help_text = help_text.strip()
+                    default_value = default_value.strip()
+                else:
+                    help_text, default_value = default_value, None
 
-            # Then check for plain variables (only if not already found as enhanced)
-            for match in self.PLAIN_PATTERN.finditer(line):
-                var_name = match.group(1)
-
-                # Skip if already found as enhanced in this line
-                if var_name not in self.variables or not self.variables[var_name].is_enhanced:
-                    self._add_variable(
-                        var_name=var_name,
-                        help_text="",
-                        sort_order=999,
-                        regex_pattern=None,
-                        default_value=None,
-                        file_path=file_path,
-                        line_number=line_num,
-                        is_enhanced=False
-                    )
+                hits.append((line_num, True, var_name, help_text, sort_order,
+                             regex_pattern, default_value))
+            else:
+                hits.append((line_num, False, hit.decode('ascii'), "", 999, None, None))
+        return hits
+
+    def _merge_hits(self, file_path: Path, hits) -> None:
+        """Add the hints found by _scan_file() to self.variables"""
+        for (line_num, is_enhanced, var_name, help_text, sort_order,
+             regex_pattern, default_value) in hits:
+            # A plain use never overrides a variable already known as enhanced
+            if (not is_enhanced and var_name in self.variables
+                    and self.variables[var_name].is_enhanced):
+                continue
+            self._add_variable(
+                var_name=var_name,
+                help_text=help_text,
+                sort_order=sort_order,
+                regex_pattern=regex_pattern,
+                default_value=default_value,
+                file_path=file_path,
+                line_number=line_num,
+                is_enhanced=is_enhanced
+            )
 
     def _add_variable(self, var_name: str, help_text: str, sort_order: int,
                      regex_pattern: Optional[str], default_value: Optional[str],
                      file_path: Path, line_number: int, is_enhanced: bool):
         """Add or update a variable"""
+        self._sorted_cache = None
+        # The same names recur across files; share one string object each
+        var_name = sys.intern(var_name)
         if var_name in self.variables:
             var = self.variables[var_name]
             var.locations.append((file_path, line_number))
@@ -2640,12 +3275,15 @@ class TemplateHintParser:
 
     def get_sorted_variables(self) -> List[TemplateVariable]:
         """Get variables sorted by sort_order, then name"""
-        return sorted(
-            self.variables.values(),
-            key=lambda v: (v.sort_order, v.name)
-        )
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(
+                self.variables.values(),
+                key=lambda v: (v.sort_order, v.name)
+            )
+        return list(self._sorted_cache)
 
-    def compile_template(self, file_path: Path) -> str:
+    def compile_template(self, file_path: Path,
+                         st: Optional[os.stat_result] = None) -> str:
         """
         Compile template file by removing hints
 
@@ -2654,21 +3292,35 @@ class TemplateHintParser:
         To:
           {{ variable }}
 
+        Args:
+            file_path: Template file
+            st: os.stat() of file_path if the caller already has it
+
         Returns:
             Compiled template content
         """
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except (UnicodeDecodeError, PermissionError):
-            return ""
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except PermissionError:
+                return ""
+        # A given file version (path, mtime, size) is compiled once per process
+        return _compile_hints_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
 
-        # Replace enhanced patterns with plain variables
-        def replace_enhanced(match):
-            _, _, _, var_name = match.groups()  # sort, regex, help, varname
-            return '{{ ' + var_name + ' }}'
+@functools.lru_cache(maxsize=512)
+def _compile_hints_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """TemplateHintParser.compile_template for one file version; mtime_ns and
+    size only serve as the cache key"""
+    try:
+        with open(path_str, encoding='utf-8') as f:
+            content = f.read()
+    except (UnicodeDecodeError, PermissionError):
+        return ""
 
-        compiled = self.ENHANCED_PATTERN.sub(replace_enhanced, content)
-        return compiled
+    # Replace enhanced patterns with plain variables (group 4 is the name);
+    # a template string keeps the substitution inside the regex engine
+    return TemplateHintParser.ENHANCED_PATTERN.sub(r'{{ \g<4> }}', content)
 
 
 class TemplateMetadata:
@@ -2688,6 +3340,8 @@ class TemplateMetadata:
     def __init__(self, template_path: Path, compiled_cache_dir: Optional[Path] = None):
         self.template_path = template_path
         self.compiled_cache_dir = compiled_cache_dir
+        # Cache subdirectories already created by get_compiled_content()
+        self._cache_dirs_made: Set[Path] = set()
         self.metadata = self._parse_metadata()
 
         # Parse inline hints from template files
@@ -2729,24 +3383,24 @@ class TemplateMetadata:
 
         return cache_file
 
-    def _is_cache_valid(self, source_file: Path, compiled_file: Path) -> bool:
+    def _is_cache_valid(self, source_mtime_ns: int, compiled_file: Path) -> bool:
         """
         Check if compiled cache is still valid
 
         Args:
-            source_file: Original template file
+            source_mtime_ns: st_mtime_ns of the original template file
             compiled_file: Compiled cache file
 
         Returns:
             True if cache is valid (compiled file is newer than source)
         """
-        if not compiled_file.exists():
+        try:
+            compiled_mtime_ns = os.stat(compiled_file).st_mtime_ns
+        except OSError:
             return False
 
-        source_mtime = source_file.stat().st_mtime
-        compiled_mtime = compiled_file.stat().st_mtime
-
-        return compiled_mtime >= source_mtime
+        # Integer nanoseconds: no float rounding at the boundary
+        return compiled_mtime_ns >= source_mtime_ns
 
     def get_compiled_content(self, source_file: Path) -> str:
         """
@@ -2770,8 +3424,9 @@ class TemplateMetadata:
         if not compiled_file:
             return self.hint_parser.compile_template(source_file)
 
-        # Check if cache is valid
-        if self._is_cache_valid(source_file, compiled_file):
+        # Check if cache is valid; the one stat also keys compile_template
+        st = os.stat(source_file)
+        if self._is_cache_valid(st.st_mtime_ns, compiled_file):
             # Return cached content
             try:
                 return compiled_file.read_text(encoding='utf-8')
@@ -2780,11 +3435,16 @@ class TemplateMetadata:
                 pass
 
         # Compile template
-        compiled_content = self.hint_parser.compile_template(source_file)
+        compiled_content = self.hint_parser.compile_template(source_file, st)
 
-        # Cache compiled content
+        # Cache compiled content (synchronously: callers and the cache tests
+        # rely on the file being in place when this returns); each cache
+        # directory is created once
         try:
-            compiled_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_subdir = compiled_file.parent
+            if cache_subdir not in self._cache_dirs_made:
+                cache_subdir.mkdir(parents=True, exist_ok=True)
+                self._cache_dirs_made.add(cache_subdir)
             write_text_lf(compiled_file, compiled_content)
         except OSError:
             # Failed to cache, but we have compiled content
@@ -2807,14 +3467,16 @@ class TemplateMetadata:
             if len(parts) >= 3:
                 frontmatter = parts[1].strip()
 
-                if HAS_YAML:
-                    try:
-                        return yaml.safe_load(frontmatter) or {}
-                    except yaml.YAMLError:
-                        pass
-
-                # Fallback: simple parsing
-                return self._parse_simple_frontmatter(frontmatter)
+                yaml = _get_yaml()
+                if yaml is None:
+                    # No PyYAML: flat key/value fallback
+                    return self._parse_simple_frontmatter(frontmatter)
+                try:
+                    return yaml.safe_load(frontmatter) or {}
+                except yaml.YAMLError as e:
+                    # A half-parsed flat dict would hide the error; report it
+                    print_warning(f"Invalid YAML front matter in {template_md}: {e}")
+                    return {}
 
         return {}
 
@@ -2954,6 +3616,10 @@ class TemplateMetadata:
 class DynamicCLIBuilder:
     """Build CLI parser with dynamic template-specific arguments"""
 
+    # Templates with more arguments than this are not registered as one
+    # argparse action each; parse_args() picks them out of argv in one pass.
+    BATCH_ARGUMENT_THRESHOLD = 16
+
     @staticmethod
     def create_base_parser() -> argparse.ArgumentParser:
         """Create parser with base arguments"""
@@ -3001,6 +3667,8 @@ class DynamicCLIBuilder:
         init_parser = subparsers.add_parser('init',
                                             help='Initialize new project',
                                             add_help=False)
+        # Direct handle for add_template_arguments()
+        parser._init_subparser = init_parser
 
         init_parser.add_argument('project_name', nargs='?',
                                  help='Project name')
@@ -3043,6 +3711,8 @@ class DynamicCLIBuilder:
                                    help='Disable interactive mode')
         control_group.add_argument('--dry-run', action='store_true',
                                    help='Show what would be created')
+        control_group.add_argument('--verbose', action='store_true',
+                                   help='List every generated file')
         control_group.add_argument('--latest', action='store_true',
                                    help='Use @* (always update) instead of @pin for version constraints')
         control_group.add_argument('-h', '--help', action='store_true',
@@ -3177,13 +3847,20 @@ class DynamicCLIBuilder:
         if not arguments:
             return parser
 
-        # Find init subparser
-        for action in parser._subparsers._actions:
-            if isinstance(action, argparse._SubParsersAction):
-                init_parser = action.choices.get('init')
-                if init_parser:
-                    break
-        else:
+        # Init subparser, stashed by create_base_parser()
+        init_parser = getattr(parser, '_init_subparser', None)
+        if init_parser is None:
+            return parser
+
+        if len(arguments) > DynamicCLIBuilder.BATCH_ARGUMENT_THRESHOLD:
+            # Names colliding with an existing option are skipped, like the
+            # ArgumentError fallback below; the first definition wins.
+            batched = {}
+            for arg in arguments:
+                arg_name = f'--{arg.name}'
+                if arg.name and arg_name not in init_parser._option_string_actions:
+                    batched.setdefault(arg_name, arg)
+            parser._batched_template_args = batched
             return parser
 
         # Create argument group
@@ -3230,11 +3907,86 @@ class DynamicCLIBuilder:
 
         return parser
 
+    @staticmethod
+    def parse_args(parser: argparse.ArgumentParser,
+                   argv: Optional[List[str]] = None) -> argparse.Namespace:
+        """
+        Parse arguments, including template arguments batched by add_template_arguments
+
+        Batched template options (--name VALUE, --name=VALUE, or --name for
+        booleans) are taken out of argv first; everything else goes through
+        argparse as usual.
+        """
+        batched = getattr(parser, '_batched_template_args', None)
+        if not batched:
+            return parser.parse_args(argv)
+
+        argv = list(sys.argv[1:] if argv is None else argv)
+        values = {arg.context_key: (False if arg.type == 'boolean' else None)
+                  for arg in batched.values()}
+        rest = []
+        i = 0
+        while i < len(argv):
+            token = argv[i]
+            i += 1
+            if token == '--':
+                rest.append(token)
+                rest.extend(argv[i:])
+                break
+            name, sep, value = token.partition('=')
+            arg = batched.get(name) if token.startswith('--') else None
+            if arg is None:
+                rest.append(token)
+                continue
+
+            if arg.type == 'boolean':
+                if sep:
+                    parser.error(f"argument {name}: ignored explicit argument '{value}'")
+                values[arg.context_key] = True
+                continue
+
+            if not sep:
+                if i >= len(argv):
+                    parser.error(f"argument {name}: expected one argument")
+                value = argv[i]
+                i += 1
+
+            if arg.type == 'integer':
+                try:
+                    value = int(value)
+                except ValueError:
+                    parser.error(f"argument {name}: invalid int value: '{value}'")
+            elif arg.type == 'choice' and arg.choices and value not in arg.choices:
+                parser.error(f"argument {name}: invalid choice: '{value}' "
+                             f"(choose from {', '.join(arg.choices)})")
+            values[arg.context_key] = value
+
+        missing = [name for name, arg in batched.items()
+                   if arg.required and values[arg.context_key] is None]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+
+        args = parser.parse_args(rest)
+        for key, value in values.items():
+            if value is not None or not hasattr(args, key):
+                setattr(args, key, value)
+        return args
+
 
 # ============================================================================
 # Template Engine - Context Builder
 # ============================================================================
 
+# Typed parsing of GRADLE_INIT_* / --config values (see ContextBuilder._parse_env_value)
+# One case-insensitive fullmatch classifies booleans and plain integers; the
+# group that matched (lastgroup) picks the conversion. Other forms int()
+# accepts (' 17', '+5', '1_000') go through the int() fallback.
+_ENV_VALUE_RE = re.compile(
+    r'(?P<true>true|yes|1)|(?P<false>false|no|0)|(?P<int>-?\d+)',
+    re.IGNORECASE | re.ASCII
+)
+
+
 class ContextBuilder:
     """Build Jinja2 rendering context with priority resolution"""
 
@@ -3257,6 +4009,11 @@ class ContextBuilder:
         self.cli_args = cli_args
         self.template_metadata = template_metadata
 
+        # GRADLE_INIT_* variables, prefix stripped and lowercased. Filtered once
+        # here so build_context does not rescan the full environment.
+        self._gi_env = {key[12:].lower(): value for key, value in env_vars.items()
+                        if key.startswith('GRADLE_INIT_')}
+
     def build_context(self) -> Dict[str, Any]:
         """
         Build complete rendering context with priority resolution
@@ -3266,46 +4023,44 @@ class ContextBuilder:
         Returns:
             Complete context dictionary for Jinja2
         """
-        context = {}
+        _parse = self._parse_env_value
 
         # 1. Base defaults from config
-        if 'defaults' in self.config:
-            context.update(self.config['defaults'])
+        defaults_layer = self.config.get('defaults', {})
 
         # 2. Custom values from config
-        if 'custom' in self.config:
-            context.update(self.config['custom'])
+        custom_layer = self.config.get('custom', {})
 
-        # 3. Environment variables (GRADLE_INIT_* prefix)
-        for key, value in self.env_vars.items():
-            if key.startswith('GRADLE_INIT_'):
-                config_key = key[12:].lower()  # Remove GRADLE_INIT_ prefix
-                context[config_key] = self._parse_env_value(value)
+        # 3. Environment variables (GRADLE_INIT_* prefix, pre-filtered in __init__)
+        env_layer = {config_key: _parse(value) for config_key, value in self._gi_env.items()}
 
         # 4. CLI arguments (highest priority)
-        for key, value in self.cli_args.items():
-            if value is not None and key not in ['help', 'func', 'command', 'config']:
-                context[key] = value
+        cli_layer = {key: value for key, value in self.cli_args.items()
+                     if value is not None and key not in ('help', 'func', 'command', 'config')}
 
         # 4a. Process --config KEY=VALUE arguments
-        if 'config' in self.cli_args and self.cli_args['config']:
-            for config_str in self.cli_args['config']:
-                if '=' in config_str:
-                    key, value = config_str.split('=', 1)
-                    # Support nested keys (e.g., spring.modules)
-                    if '.' in key:
-                        # Convert "spring.modules" to nested dict access
-                        keys = key.split('.')
-                        # For simplicity, flatten to underscore
-                        flat_key = '_'.join(keys)
-                        context[flat_key] = self._parse_env_value(value)
-                    else:
-                        context[key] = self._parse_env_value(value)
+        config_layer = {}
+        for config_str in self.cli_args.get('config') or ():
+            if '=' in config_str:
+                key, value = config_str.split('=', 1)
+                # Support nested keys (e.g., spring.modules): flatten to underscore
+                if '.' in key:
+                    key = '_'.join(key.split('.'))
+                config_layer[key] = _parse(value)
 
         # 5. Computed values
-        context['timestamp'] = datetime.now().isoformat()
-        context['year'] = datetime.now().year
-        context['date'] = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now()
+        computed_layer = {
+            'timestamp': now.isoformat(),
+            'year': now.year,
+            'date': now.strftime('%Y-%m-%d'),
+        }
+
+        # Later layers win; merged in one pass per layer
+        context = {}
+        for layer in (defaults_layer, custom_layer, env_layer, cli_layer,
+                      config_layer, computed_layer):
+            context.update(layer)
 
         # 6. Template-specific defaults
         template_args = self.template_metadata.get_arguments()
@@ -3336,13 +4091,13 @@ class ContextBuilder:
         Returns:
             Parsed value
         """
-        # Boolean
-        if value.lower() in ('true', 'yes', '1'):
-            return True
-        if value.lower() in ('false', 'no', '0'):
-            return False
-
-        # Integer
+        # Boolean or integer
+        match = _ENV_VALUE_RE.fullmatch(value)
+        if match:
+            kind = match.lastgroup
+            if kind == 'int':
+                return int(value)
+            return kind == 'true'
         try:
             return int(value)
         except ValueError:
@@ -3360,32 +4115,46 @@ class ContextBuilder:
 # Template Engine - Jinja2 Setup
 # ============================================================================
 
-def setup_jinja2_environment(template_path: Path, context: Dict[str, Any] = None) -> jinja2.Environment:
-    """
-    Setup Jinja2 environment with custom filters and tests
+# Process-wide base environment carrying options, filters, tests and globals.
+# Built once by setup_jinja2_environment; each call returns an overlay of it.
+_JINJA_ENV = None
 
-    Args:
-        template_path: Path to template directory
-        context: Template context for config function
 
-    Returns:
-        Configured Jinja2 environment
-    """
-    loader = jinja2.FileSystemLoader(str(template_path))
+def _format_datetime(dt_str: str, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+    """Format a datetime string or datetime object"""
+    try:
+        if isinstance(dt_str, str):
+            # Try parsing ISO format first
+            dt = datetime.fromisoformat(dt_str)
+        elif isinstance(dt_str, datetime):
+            dt = dt_str
+        else:
+            return str(dt_str)
+        return dt.strftime(fmt)
+    except (ValueError, AttributeError):
+        return str(dt_str)
+
+
+def _create_base_jinja2_environment() -> 'jinja2.Environment':
+    """Create the shared Jinja2 environment with custom filters, tests and globals"""
+    import jinja2
 
     env = jinja2.Environment(
-        loader=loader,
         trim_blocks=True,
         lstrip_blocks=True,
         keep_trailing_newline=True,
-        undefined=jinja2.StrictUndefined  # Fail on undefined variables
+        undefined=jinja2.StrictUndefined,  # Fail on undefined variables
+        autoescape=False,  # Generating source code, not HTML
+        extensions=(),
+        cache_size=-1,  # Keep every loaded template; a run loads each once
+        auto_reload=False  # Templates do not change during a run; skip mtime checks
     )
 
     # Custom filters for naming conventions
-    env.filters['camelCase'] = lambda s: _to_camel_case(s)
-    env.filters['PascalCase'] = lambda s: _to_pascal_case(s)
-    env.filters['snake_case'] = lambda s: _to_snake_case(s)
-    env.filters['kebab_case'] = lambda s: _to_kebab_case(s)
+    env.filters['camelCase'] = _to_camel_case
+    env.filters['PascalCase'] = _to_pascal_case
+    env.filters['snake_case'] = _to_snake_case
+    env.filters['kebab_case'] = _to_kebab_case
     env.filters['package_path'] = lambda s: s.replace('.', '/')
 
     # Custom filters for text manipulation
@@ -3393,23 +4162,9 @@ def setup_jinja2_environment(template_path: Path, context: Dict[str, Any] = None
     env.filters['lower_first'] = lambda s: s[0].lower() + s[1:] if s else s
 
     # Custom datetime filters
-    def format_datetime(dt_str: str, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
-        """Format a datetime string or datetime object"""
-        try:
-            if isinstance(dt_str, str):
-                # Try parsing ISO format first
-                dt = datetime.fromisoformat(dt_str)
-            elif isinstance(dt_str, datetime):
-                dt = dt_str
-            else:
-                return str(dt_str)
-            return dt.strftime(fmt)
-        except (ValueError, AttributeError):
-            return str(dt_str)
-
-    env.filters['datetime'] = format_datetime
-    env.filters['date'] = lambda dt, fmt='%Y-%m-%d': format_datetime(dt, fmt)
-    env.filters['time'] = lambda dt, fmt='%H:%M:%S': format_datetime(dt, fmt)
+    env.filters['datetime'] = _format_datetime
+    env.filters['date'] = lambda dt, fmt='%Y-%m-%d': _format_datetime(dt, fmt)
+    env.filters['time'] = lambda dt, fmt='%H:%M:%S': _format_datetime(dt, fmt)
 
     # Custom tests
     env.tests['springboot'] = lambda x: 'springboot' in str(x).lower()
@@ -3420,9 +4175,64 @@ def setup_jinja2_environment(template_path: Path, context: Dict[str, Any] = None
     env.globals['datetime'] = datetime
 
     # Add environment access
-    import os as _os
-    env.globals['env'] = _os.environ.get
-    env.globals['getenv'] = _os.getenv
+    env.globals['env'] = os.environ.get
+    env.globals['getenv'] = os.getenv
+
+    return env
+
+
+@functools.lru_cache(maxsize=32)
+def _get_path_jinja2_environment(template_path: str,
+                                 bytecode_cache_dir: Optional[str]) -> 'jinja2.Environment':
+    """
+    Return the overlay of the base environment bound to one template path
+
+    Cached so repeated generations from the same template (subprojects,
+    several ProjectGenerator instances) reuse the loader and bytecode cache
+    objects. Loaded templates are not shared: each setup_jinja2_environment()
+    overlay has its own template cache, since its templates are bound to its
+    own config() global.
+    """
+    import jinja2
+
+    global _JINJA_ENV
+    if _JINJA_ENV is None:
+        _JINJA_ENV = _create_base_jinja2_environment()
+
+    overlay_kwargs = {'loader': jinja2.FileSystemLoader(template_path)}
+    if bytecode_cache_dir is not None:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        overlay_kwargs['bytecode_cache'] = jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
+
+    return _JINJA_ENV.overlay(**overlay_kwargs)
+
+
+def setup_jinja2_environment(template_path: Path, context: Dict[str, Any] = None,
+                             bytecode_cache_dir: Optional[Path] = None) -> 'jinja2.Environment':
+    """
+    Setup Jinja2 environment with custom filters and tests
+
+    Filters, tests and globals are registered once on a shared base
+    environment, and the loader is bound once per template path; every call
+    returns a lightweight overlay of that with its own config() global and
+    its own (initially empty) in-memory template cache. Repeat generations
+    skip recompiling through the bytecode cache, when one is configured.
+
+    Args:
+        template_path: Path to template directory
+        context: Template context for config function
+        bytecode_cache_dir: Optional directory for persisting compiled templates
+
+    Returns:
+        Configured Jinja2 environment
+    """
+    path_env = _get_path_jinja2_environment(
+        str(template_path),
+        str(bytecode_cache_dir) if bytecode_cache_dir is not None else None)
+
+    env = path_env.overlay()
+    # Overlays share the globals dict; copy it so config() stays per-context
+    env.globals = dict(_JINJA_ENV.globals)
 
     # Add config function as global
     if context:
@@ -3445,38 +4255,55 @@ def setup_jinja2_environment(template_path: Path, context: Dict[str, Any] = None
     return env
 
 
+# Case-conversion patterns used by the camelCase/PascalCase/snake_case/kebab_case filters.
+# The filters are memoized: templates apply them to the same few names over and over.
+# _WORD_BOUNDARY is the zero-width point before an uppercase letter that starts
+# a word ("myApp", "HTTPResponse") or follows a lowercase letter/digit; the
+# split/sub variants fold the delimiter handling into the same single pass.
+_WORD_BOUNDARY = r'(?<=[^\n])(?=[A-Z][a-z])|(?<=[a-z0-9])(?=[A-Z])'
+_CAMEL_SPLIT = re.compile(r'[-_\s]+|' + _WORD_BOUNDARY)
+_SNAKE_SUB = re.compile(r'[-\s]+|' + _WORD_BOUNDARY)
+_DELIM_SPLIT = re.compile(r'[-_\s]+')
+
+
+@functools.lru_cache(maxsize=1024)
 def _to_camel_case(s: str) -> str:
     """Convert string to camelCase"""
-    # Handle PascalCase/camelCase by inserting delimiters before uppercase
-    s_with_delimiters = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', s)
-    s_with_delimiters = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s_with_delimiters)
-
-    # Split on delimiters
-    parts = re.split(r'[-_\s]+', s_with_delimiters)
+    # Single lowercase word: nothing to split or recase
+    if s.isalnum() and s.islower():
+        return s
+    # Split on delimiters and before uppercase word starts in one pass
+    parts = _CAMEL_SPLIT.split(s)
     if not parts:
         return s
     return parts[0].lower() + ''.join(p.capitalize() for p in parts[1:])
 
 
+@functools.lru_cache(maxsize=1024)
 def _to_pascal_case(s: str) -> str:
     """Convert string to PascalCase"""
-    parts = re.split(r'[-_\s]+', s)
+    if s.isalnum():
+        return s.capitalize()
+    parts = _DELIM_SPLIT.split(s)
     return ''.join(p.capitalize() for p in parts)
 
 
+@functools.lru_cache(maxsize=1024)
 def _to_snake_case(s: str) -> str:
     """Convert string to snake_case"""
-    # Insert underscore before uppercase letters
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', s)
-    # Insert underscore before uppercase letters preceded by lowercase
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
-    # Replace spaces and hyphens with underscores
-    s3 = re.sub(r'[-\s]+', '_', s2)
-    return s3.lower()
+    # Already lowercase words joined by underscores
+    if s.islower() and s.replace('_', '').isalnum():
+        return s
+    # Underscore before word starts, spaces and hyphens become underscores
+    return _SNAKE_SUB.sub('_', s).lower()
 
 
+@functools.lru_cache(maxsize=1024)
 def _to_kebab_case(s: str) -> str:
     """Convert string to kebab-case"""
+    # Already lowercase words joined by single hyphens
+    if s.islower() and '_' not in s and '--' not in s and s.replace('-', '').isalnum():
+        return s
     snake = _to_snake_case(s)
     return snake.replace('_', '-')
 
@@ -3536,11 +4363,16 @@ class ProjectGenerator:
     # Suffix for raw files (copied without Jinja2 processing, suffix removed)
     RAW_SUFFIX = '.raw'
 
+    # Below this many files, rendering in a thread pool costs more than it saves
+    PARALLEL_MIN_FILES = 8
+
     def __init__(self,
                  template_path: Path,
                  context: Dict[str, Any],
                  target_path: Path,
-                 template_metadata: Optional['TemplateMetadata'] = None):
+                 template_metadata: Optional['TemplateMetadata'] = None,
+                 jinja_cache_dir: Optional[Path] = None,
+                 verbose: bool = False):
         """
         Initialize project generator
 
@@ -3549,12 +4381,22 @@ class ProjectGenerator:
             context: Rendering context
             target_path: Where to create the project
             template_metadata: Optional template metadata for hint compilation
+            jinja_cache_dir: Optional directory for the Jinja2 bytecode cache
+            verbose: List every processed file instead of only a summary
         """
         self.template_path = template_path
-        self.context = context
+        # Read-only view, passed to Jinja2 as one mapping instead of **-spread per render
+        self.context = MappingProxyType(dict(context))
         self.target_path = target_path
         self.template_metadata = template_metadata
-        self.jinja_env = setup_jinja2_environment(template_path, context)
+        self.verbose = verbose
+        # (kind, progress line) per processed file; list.append is thread-safe
+        self._file_log: List[Tuple[str, str]] = []
+        self.jinja_env = setup_jinja2_environment(template_path, context, jinja_cache_dir)
+        # Rendered path segments; the context is fixed for the lifetime of a generator
+        self._path_cache: Dict[str, str] = {}
+        # Target directories already created
+        self._made_dirs: Set[str] = set()
 
     def generate(self) -> bool:
         """
@@ -3566,12 +4408,16 @@ class ProjectGenerator:
         Raises:
             Exception: If generation fails
         """
+        import jinja2
+
         try:
             # 1. Validate target doesn't exist or is empty
             if self.target_path.exists():
-                if any(self.target_path.iterdir()):
-                    print_error(f"Target directory not empty: {self.target_path}")
-                    return False
+                # One entry is enough to know the directory is not empty
+                with os.scandir(self.target_path) as it:
+                    if next(it, None) is not None:
+                        print_error(f"Target directory not empty: {self.target_path}")
+                        return False
             else:
                 self.target_path.mkdir(parents=True, exist_ok=True)
 
@@ -3609,93 +4455,154 @@ class ProjectGenerator:
 
     def _process_directory(self, source_dir: Path, target_dir: Path):
         """
-        Recursively process template directory
+        Process template directory tree
+
+        Walks the tree with os.scandir, so directory checks come from the
+        directory listing, and renders one name per entry, so a directory
+        name is rendered once rather than once per file below it. All
+        target directories are created first; the files are then processed,
+        in a thread pool once there are PARALLEL_MIN_FILES or more of them.
 
         Args:
             source_dir: Source template directory
             target_dir: Target project directory
         """
-        for item in source_dir.iterdir():
-            # Skip unwanted files/directories
-            if self._should_skip(item):
-                continue
+        # (source directory, its rendered target directory, its template-relative
+        # name with '/' separators and a trailing '/', or '' for the root)
+        pending = [(str(source_dir), str(target_dir), '')]
+        files: List[Tuple[Path, Path, str]] = []
+
+        while pending:
+            source, target, rel_dir = pending.pop()
+            with os.scandir(source) as it:
+                entries = list(it)
+
+            for entry in entries:
+                # Skip unwanted files/directories
+                if self._should_skip(entry):
+                    continue
 
-            # Calculate relative path
-            rel_path = item.relative_to(self.template_path)
+                # Render the name (for dynamic names); parents are rendered already
+                target_item = os.path.join(target, self._render_path(entry.name))
 
-            # Render path (for dynamic names)
-            rendered_rel_path = self._render_path(str(rel_path))
-            target_item = self.target_path / rendered_rel_path
+                if entry.is_dir():
+                    # Create directory, process its contents later
+                    os.makedirs(target_item, exist_ok=True)
+                    self._made_dirs.add(target_item)
+                    pending.append((entry.path, target_item, f"{rel_dir}{entry.name}/"))
+                else:
+                    files.append((Path(entry.path), Path(target_item), rel_dir + entry.name))
 
-            if item.is_dir():
-                # Create directory
-                target_item.mkdir(parents=True, exist_ok=True)
-                # Process subdirectory
-                self._process_directory(item, target_item)
-            else:
-                # Process file
-                self._process_file(item, target_item)
+        # Larger trees: ask the kernel to start reading every file now, so the
+        # reads overlap with rendering instead of happening one by one
+        if len(files) >= self.PARALLEL_MIN_FILES:
+            _prefetch_files(str(source_file) for source_file, _, _ in files)
 
-    def _process_file(self, source_file: Path, target_file: Path):
+        # All target directories exist now; render/copy the files
+        try:
+            if len(files) < self.PARALLEL_MIN_FILES:
+                for source_file, target_file, rel_name in files:
+                    self._process_file(source_file, target_file, rel_name)
+            else:
+                workers = min(32, (os.cpu_count() or 1) * 2)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(self._process_file, *item) for item in files]
+                for future in futures:
+                    future.result()
+        finally:
+            self._report_files()
+
+    def _report_files(self):
+        """Print the per-file log (verbose only, in one write) and a summary line"""
+        log, self._file_log = self._file_log, []
+        if self.verbose and log:
+            with _OUTPUT_LOCK:
+                sys.stdout.write(''.join(f"->   {line}\n" for _, line in log))
+                sys.stdout.flush()
+        rendered = sum(1 for kind, _ in log if kind == 'rendered')
+        print_info(f"{len(log)} files generated ({rendered} rendered, "
+                   f"{len(log) - rendered} copied)")
+
+    def _process_file(self, source_file: Path, target_file: Path,
+                      rel_name: Optional[str] = None):
         """
         Process single template file
 
         Args:
             source_file: Source template file
             target_file: Target project file
+            rel_name: Template-relative name with '/' separators (derived if omitted)
         """
+        if rel_name is None:
+            rel_name = source_file.relative_to(self.template_path).as_posix()
+
         # Check if this is a raw file (bypass Jinja2, remove .raw suffix)
         is_raw = source_file.name.endswith(self.RAW_SUFFIX)
         if is_raw:
             # Remove .raw suffix from target filename
             target_file = target_file.parent / target_file.name[:-len(self.RAW_SUFFIX)]
 
-        # Ensure parent directory exists
-        target_file.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists (once per directory)
+        parent = str(target_file.parent)
+        if parent not in self._made_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._made_dirs.add(parent)
 
         if is_raw:
             # Raw files: copy without Jinja2 processing
-            self._copy_raw_file(source_file, target_file)
+            self._copy_raw_file(source_file, target_file, rel_name)
         elif self._is_text_file(source_file):
             # Text files: render with Jinja2
-            self._render_text_file(source_file, target_file)
+            self._render_text_file(source_file, target_file, rel_name)
         else:
             # Binary files: copy as-is
-            self._copy_binary_file(source_file, target_file)
+            self._copy_binary_file(source_file, target_file, rel_name)
 
-    def _render_text_file(self, source_file: Path, target_file: Path):
+    def _render_text_file(self, source_file: Path, target_file: Path,
+                          rel_name: Optional[str] = None):
         """
         Render text file with Jinja2
 
         If template_metadata is available, compiles the template first
-        to remove inline hints before Jinja2 rendering.
+        to remove inline hints before Jinja2 rendering. The output keeps the
+        source file's permission bits.
 
         Args:
             source_file: Source template file
             target_file: Target project file
+            rel_name: Template-relative name with '/' separators (derived if omitted)
         """
+        import jinja2
+
         try:
-            # Get template relative path
-            rel_path = source_file.relative_to(self.template_path)
+            # Template relative name; '/' separators are what Jinja2 expects
+            if rel_name is None:
+                rel_name = source_file.relative_to(self.template_path).as_posix()
+
+            # No Jinja2 markers (and hence no inline hints): rendering would only
+            # normalize line endings, so do just that
+            data = source_file.read_bytes()
+            if b'{{' not in data and b'{%' not in data and b'{#' not in data:
+                target_file.write_bytes(data.replace(b'\r\n', b'\n').replace(b'\r', b'\n'))
+                shutil.copymode(source_file, target_file)
+                self._file_log.append(('rendered', f"[OK] {rel_name}"))
+                return
 
             # Compile template if metadata available (removes inline hints)
             if self.template_metadata:
                 compiled_content = self.template_metadata.compile_template_file(source_file)
                 # Render directly from string
-                template = self.jinja_env.from_string(compiled_content)
-                content = template.render(**self.context)
+                template = self._template_from_string(compiled_content, rel_name,
+                                                      str(source_file))
             else:
                 # Legacy: direct template rendering
-                # Convert to forward slashes for Jinja2 (cross-platform)
-                template_name = str(rel_path).replace('\\', '/')
-                # Load and render template
-                template = self.jinja_env.get_template(template_name)
-                content = template.render(**self.context)
+                template = self.jinja_env.get_template(rel_name)
 
-            # Write rendered content
-            write_text_lf(target_file, content)
+            # Stream rendered content to the file
+            write_chunks_lf(target_file, template.generate(self.context))
+            shutil.copymode(source_file, target_file)
 
-            print_info(f"  [OK] {rel_path}")
+            self._file_log.append(('rendered', f"[OK] {rel_name}"))
 
         except jinja2.UndefinedError as e:
             print_error(f"Undefined variable in {source_file.name}: {e}")
@@ -3704,19 +4611,48 @@ class ProjectGenerator:
             print_error(f"Error rendering {source_file.name}: {e}")
             raise
 
-    def _copy_binary_file(self, source_file: Path, target_file: Path):
+    def _template_from_string(self, source: str, name: str,
+                              filename: Optional[str] = None) -> 'jinja2.Template':
+        """
+        Like jinja_env.from_string(), but served from the bytecode cache if enabled
+
+        Args:
+            source: Template source
+            name: Template name (template-relative)
+            filename: Absolute source path; part of the cache key, so the
+                same relative name in different templates gets its own entry
+
+        Returns:
+            Compiled template
+        """
+        env = self.jinja_env
+        bcc = env.bytecode_cache
+        if bcc is None:
+            return env.from_string(source)
+
+        bucket = bcc.get_bucket(env, name, filename, source)
+        if bucket.code is None:
+            bucket.code = env.compile(source, name, filename)
+            bcc.set_bucket(bucket)
+        return env.template_class.from_code(env, bucket.code, env.make_globals(None))
+
+    def _copy_binary_file(self, source_file: Path, target_file: Path,
+                          rel_name: Optional[str] = None):
         """
         Copy binary file as-is
 
         Args:
             source_file: Source file
             target_file: Target file
+            rel_name: Template-relative name with '/' separators (derived if omitted)
         """
-        shutil.copy2(source_file, target_file)
-        rel_path = source_file.relative_to(self.template_path)
-        print_info(f"  -> {rel_path}")
+        copy_file_fast(source_file, target_file)
+        if rel_name is None:
+            rel_name = source_file.relative_to(self.template_path).as_posix()
+        self._file_log.append(('copied', f"-> {rel_name}"))
 
-    def _copy_raw_file(self, source_file: Path, target_file: Path):
+    def _copy_raw_file(self, source_file: Path, target_file: Path,
+                       rel_name: Optional[str] = None):
         """
         Copy raw file as-is (no Jinja2 processing, .raw suffix already removed from target)
 
@@ -3726,12 +4662,14 @@ class ProjectGenerator:
         Args:
             source_file: Source file (with .raw suffix)
             target_file: Target file (without .raw suffix)
+            rel_name: Template-relative name with '/' separators (derived if omitted)
         """
-        shutil.copy2(source_file, target_file)
-        rel_path = source_file.relative_to(self.template_path)
+        copy_file_fast(source_file, target_file)
+        if rel_name is None:
+            rel_name = source_file.relative_to(self.template_path).as_posix()
         # Show target name without .raw suffix
         target_name = target_file.name
-        print_info(f"  -> {rel_path} -> {target_name}")
+        self._file_log.append(('copied', f"-> {rel_name} -> {target_name}"))
 
     def _render_path(self, path: str) -> str:
         """
@@ -3743,17 +4681,33 @@ class ProjectGenerator:
         Returns:
             Rendered path
         """
+        # Most names are literal; skip Jinja2 entirely for them
+        if '{{' not in path and '{%' not in path:
+            return path
+
+        import jinja2
+
+        rendered = self._path_cache.get(path)
+        if rendered is not None:
+            return rendered
+
         try:
             template = self.jinja_env.from_string(path)
-            return template.render(**self.context)
+            rendered = template.render(self.context)
         except jinja2.TemplateError:
             # If rendering fails, return original path
-            return path
+            rendered = path
+
+        self._path_cache[path] = rendered
+        return rendered
 
     def _is_text_file(self, file_path: Path) -> bool:
         """
         Check if file should be treated as text (rendered)
 
+        Only known text extensions are rendered; anything else is copied
+        byte-for-byte (e.g. .cmd scripts keep their CRLF line endings).
+
         Args:
             file_path: File to check
 
@@ -3762,12 +4716,12 @@ class ProjectGenerator:
         """
         return file_path.suffix in self.TEXT_EXTENSIONS
 
-    def _should_skip(self, path: Path) -> bool:
+    def _should_skip(self, path: Union[Path, os.DirEntry]) -> bool:
         """
         Check if file/directory should be skipped
 
         Args:
-            path: Path to check
+            path: Path or directory entry to check (only the name is used)
 
         Returns:
             True if should be skipped
@@ -3798,40 +4752,22 @@ class ProjectGenerator:
             self._generate_gradle_wrapper()
 
         # Initialize git repository
-        if GIT_AVAILABLE:
+        if check_git_available():
             try:
                 # Git init
                 print_info("Executing: git init")
                 print_info(f"Working directory: {self.target_path}")
-                result = subprocess.run(
-                    ['git', 'init'],
-                    cwd=self.target_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+                result = self._run_git('init')
                 if result.stdout.strip():
                     print(f"  {result.stdout.strip()}")
 
-                # Git add
+                # Git add (nothing to show, so no stdout pipe)
                 print_info("Executing: git add .")
-                result = subprocess.run(
-                    ['git', 'add', '.'],
-                    cwd=self.target_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+                self._run_git('add', '.', show_output=False)
 
                 # Git commit
                 print_info("Executing: git commit -m 'Initial commit from gradleInit'")
-                result = subprocess.run(
-                    ['git', 'commit', '-m', 'Initial commit from gradleInit'],
-                    cwd=self.target_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+                result = self._run_git('commit', '-m', 'Initial commit from gradleInit')
                 if result.stdout.strip():
                     print(f"  {result.stdout.strip()}")
 
@@ -3846,6 +4782,27 @@ class ProjectGenerator:
         else:
             print_info("Git not available - skipping repository initialization")
 
+    def _run_git(self, *args: str, show_output: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a git command in the target directory, raising CalledProcessError on failure
+
+        stderr is always captured for the failure report; stdout only when
+        show_output is set. No console window is allocated on Windows.
+
+        The directory is passed with -C rather than cwd, and descriptors are
+        not closed, so CPython can use posix_spawn instead of fork/exec.
+        """
+        return subprocess.run(
+            [shutil.which('git') or 'git', '-C', str(self.target_path), *args],
+            close_fds=False,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if show_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if IS_WINDOWS else 0
+        )
+
     def _generate_gradle_wrapper(self):
         """
         Generate Gradle Wrapper using the reliable empty-file method.
@@ -4035,7 +4992,8 @@ class SubprojectGenerator:
         """
         self.template_path = template_path
         self.template_metadata = template_metadata
-        self.context = context
+        # Read-only view, passed to Jinja2 as one mapping instead of **-spread per render
+        self.context = MappingProxyType(dict(context))
         self.root_path = root_path
         self.subproject_name = subproject_name
         self.target_path = root_path / subproject_name
@@ -4111,10 +5069,18 @@ class SubprojectGenerator:
                     return True
         return False
 
-    def _process_directory(self, source_dir: Path, target_dir: Path):
-        """Process directory recursively"""
-        for item in source_dir.iterdir():
-            rel_path = str(item.relative_to(self.template_path))
+    def _process_directory(self, source_dir: Path, target_dir: Path, rel_dir: str = ''):
+        """Process directory recursively
+
+        rel_dir is source_dir relative to the template root, with a trailing
+        separator (or '' for the root), so entries need no relative_to().
+        """
+        raw_copy = self.template_metadata.get_raw_copy_files()
+        with os.scandir(source_dir) as it:
+            entries = list(it)
+
+        for item in entries:
+            rel_path = rel_dir + item.name
 
             # Skip patterns
             if self._should_skip(rel_path):
@@ -4133,7 +5099,6 @@ class SubprojectGenerator:
                 continue
 
             # Skip raw_copy files that are in skip list
-            raw_copy = self.template_metadata.get_raw_copy_files()
             if item.name in raw_copy and self._should_skip(item.name):
                 continue
 
@@ -4141,9 +5106,9 @@ class SubprojectGenerator:
 
             if item.is_dir():
                 target_item.mkdir(parents=True, exist_ok=True)
-                self._process_directory(item, target_item)
+                self._process_directory(Path(item.path), target_item, rel_path + os.sep)
             else:
-                self._process_file(item, target_item)
+                self._process_file(Path(item.path), target_item)
 
     def _process_file(self, source_file: Path, target_file: Path):
         """Process single file"""
@@ -4153,7 +5118,7 @@ class SubprojectGenerator:
         if source_file.name.endswith('.raw'):
             # Copy without processing, remove .raw suffix
             actual_target = target_file.parent / target_file.name[:-4]
-            shutil.copy2(source_file, actual_target)
+            copy_file_fast(source_file, actual_target)
             rel_path = source_file.relative_to(self.template_path)
             print_info(f"  [OK] {rel_path} (raw)")
             return
@@ -4161,7 +5126,7 @@ class SubprojectGenerator:
         # Check for raw copy from metadata
         raw_copy = self.template_metadata.get_raw_copy_files()
         if source_file.name in raw_copy:
-            shutil.copy2(source_file, target_file)
+            copy_file_fast(source_file, target_file)
             rel_path = source_file.relative_to(self.template_path)
             print_info(f"  [OK] {rel_path} (raw)")
             return
@@ -4175,7 +5140,7 @@ class SubprojectGenerator:
                 rel_path = str(source_file.relative_to(self.template_path)).replace('\\', '/')
                 template = self.jinja_env.get_template(rel_path)
 
-            content = template.render(**self.context)
+            content = template.render(self.context)
             write_text_lf(target_file, content)
 
             rel_path = source_file.relative_to(self.template_path)
@@ -4197,7 +5162,7 @@ class SubprojectGenerator:
         try:
             compiled_content = self.template_metadata.compile_template_file(source_file)
             template = self.jinja_env.from_string(compiled_content)
-            content = template.render(**self.context)
+            content = template.render(self.context)
             write_text_lf(target_file, content)
             print_info(f"  [OK] build.gradle.kts (from {self.build_file})")
         except Exception as e:
@@ -4247,7 +5212,7 @@ class SubprojectGenerator:
 
                 # Render Jinja2 variables
                 jinja_template = self.jinja_env.from_string(compiled)
-                template_content = jinja_template.render(**self.context)
+                template_content = jinja_template.render(self.context)
             else:
                 template_content = template_raw
 
@@ -4405,26 +5370,54 @@ class SubprojectGenerator:
 # Helper Function - Load Configuration
 # ============================================================================
 
+# Parsed config files keyed by (path, mtime_ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
 def load_config(config_file: Path) -> Dict[str, Any]:
     """
     Load configuration from .gradleInit file
 
+    Parsed with the C-accelerated tomllib where available (Python 3.11+);
+    a file is parsed at most once per process until its mtime changes.
+
     Args:
         config_file: Path to config file
 
     Returns:
         Configuration dictionary
     """
-    if not config_file.exists():
-        return {}
-
     try:
-        config_text = config_file.read_text()
-        return toml.loads(config_text)
-    except Exception as e:
-        print_warning(f"Failed to load config: {e}")
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
         return {}
 
+    key = (str(config_file), mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        try:
+            import tomllib  # Python 3.11+
+        except ImportError:
+            tomllib = None
+
+        try:
+            data = config_file.read_bytes()
+            try:
+                cached = tomllib.loads(data.decode('utf-8')) if tomllib else None
+            except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+                cached = None
+            if cached is None:
+                # No tomllib, or a file only the more lenient toml package accepts
+                import toml
+                cached = toml.loads(data.decode('utf-8', errors='replace'))
+        except Exception as e:
+            print_warning(f"Failed to load config: {e}")
+            return {}
+        _CONFIG_CACHE[key] = cached
+
+    # Callers may modify the result; never hand out the cached dict itself
+    return copy.deepcopy(cached)
+
 
 # ============================================================================
 # Command Handlers
@@ -4454,26 +5447,33 @@ def handle_templates_command(args: argparse.Namespace,
             return 0
 
         # Group by repository
-        by_repo = {}
+        by_repo = defaultdict(list)
         for tmpl in templates:
-            repo = tmpl['repository']
-            if repo not in by_repo:
-                by_repo[repo] = []
-            by_repo[repo].append(tmpl)
+            by_repo[tmpl['repository']].append(tmpl)
+
+        # Load all metadata up front; reading TEMPLATE.md and the template
+        # files is I/O-bound, so the loads overlap well in threads
+        workers = min(8, len(templates))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            all_metadata = dict(zip(
+                (tmpl['path'] for tmpl in templates),
+                pool.map(lambda t: TemplateMetadata(Path(t['path'])), templates)))
 
-        for repo_name in sorted(by_repo.keys()):
-            print(f"\n{repo_name}:")
-            for tmpl in by_repo[repo_name]:
-                template_path = Path(tmpl['path'])
-                metadata = TemplateMetadata(template_path)
+        # Build the listing and write it in one go
+        lines = []
+        for repo_name, repo_templates in sorted(by_repo.items()):
+            lines.append(f"\n{repo_name}:")
+            for tmpl in repo_templates:
+                metadata = all_metadata[tmpl['path']]
 
-                print(f"  {tmpl['name']:35} {metadata.get_description()}")
+                lines.append(f"  {tmpl['name']:35} {metadata.get_description()}")
 
                 tags = metadata.get_tags()
                 if tags:
-                    print(f"  {'':35} [{', '.join(tags)}]")
+                    lines.append(f"  {'':35} [{', '.join(tags)}]")
 
-        print()
+        lines.append('')
+        sys.stdout.write('\n'.join(lines) + '\n')
         return 0
 
     if args.update:
@@ -4580,6 +5580,7 @@ def handle_config_command(args: argparse.Namespace, paths: GradleInitPaths) -> i
         print(f"Config file: {paths.config_file}")
         print()
 
+        import toml
         config = toml.loads(paths.config_file.read_text())
         print(toml.dumps(config))
 
@@ -4830,6 +5831,7 @@ def handle_init_command(args: argparse.Namespace,
             print("  --latest                  Shortcut for --version_policy @* (track newest)")
             print("  --config KEY=VALUE        Set template configuration")
             print("  --dry-run                 Show what would be created, change nothing")
+            print("  --verbose                 List every generated file")
             print("  --interactive             Interactive mode with prompts")
             print("  --no-interactive          Non-interactive mode (default)")
             print()
@@ -4946,6 +5948,7 @@ def handle_init_command(args: argparse.Namespace,
             print("  --jdk-version VERSION     JDK version")
             print("  --latest                  Shortcut for --version_policy @* (track newest)")
             print("  --dry-run                 Show what would be created, change nothing")
+            print("  --verbose                 List every generated file")
             print("  --interactive, -i         Prompt for missing values")
             print()
 
@@ -4979,6 +5982,7 @@ def handle_init_command(args: argparse.Namespace,
             print("  --latest                  Shortcut for --version_policy @* (track newest)")
             print("  --config KEY=VALUE        Set template configuration")
             print("  --dry-run                 Show what would be created, change nothing")
+            print("  --verbose                 List every generated file")
             print("  --interactive, -i         Prompt for missing values")
             print()
             print("Available Templates:")
@@ -5091,6 +6095,8 @@ def handle_init_command(args: argparse.Namespace,
     print_info(f"Template path: {template_path}")
     print()
 
+    import jinja2
+
     try:
         # Validate requirements
         requirements = metadata.get_requirements()
@@ -5186,7 +6192,9 @@ def handle_init_command(args: argparse.Namespace,
             template_path=template_path,
             context=context,
             target_path=target_path,
-            template_metadata=metadata  # Pass metadata for hint compilation
+            template_metadata=metadata,  # Pass metadata for hint compilation
+            jinja_cache_dir=paths.cache_dir / 'jinja' if JINJA_BYTECODE_CACHE else None,
+            verbose=getattr(args, 'verbose', False)
         )
 
         # Execute generation
@@ -5291,8 +6299,8 @@ def handle_subproject_command(args: argparse.Namespace,
     if not template_path:
         print_error(f"Template not found: {args.template}")
         print_info("Available templates:")
-        for name, tmpl_path in repo_manager.list_templates():
-            print(f"  - {name}")
+        for entry in repo_manager.list_all_templates():
+            print(f"  - {entry['name']}")
         return 1
 
     # Load template metadata
@@ -6439,7 +7447,7 @@ def main():
         print(f"gradleInit v{SCRIPT_VERSION}")
         try:
             diag_paths = GradleInitPaths()
-            diag_paths.ensure_structure()
+            diag_paths.ensure_structure(create_config=False)
             print_environment_diagnostics(diag_paths)
         except Exception as exc:
             print_warning(f"diagnostics unavailable: {exc}")
@@ -6449,7 +7457,7 @@ def main():
         print()
 
     # Check git availability
-    if not GIT_AVAILABLE:
+    if not check_git_available():
         print_warning("Git not found!")
         print()
         print("gradleInit requires git for:")
@@ -6467,16 +7475,7 @@ def main():
 
     # Initialize paths
     paths = GradleInitPaths()
-    paths.ensure_structure()
-
-    # Load config and ensure maven.recent_hours exists
-    config = load_config(paths.config_file)
-    if 'maven' not in config:
-        config['maven'] = {}
-    if 'recent_hours' not in config.get('maven', {}):
-        config['maven']['recent_hours'] = 48
-        save_config(paths.config_file, config)
-    recent_hours = config.get('maven', {}).get('recent_hours', 48)
+    paths.ensure_structure(create_config=False)
 
     # Initialize module loader
     module_loader = ModuleLoader(paths)
@@ -6512,6 +7511,15 @@ def main():
         success = uninstall_scoop_shims()
         return 0 if success else 1
 
+    # Load config (created on first use, so not for the commands above) and
+    # ensure maven.recent_hours exists
+    config = paths.get_config()
+    if 'maven' not in config:
+        config['maven'] = {}
+    if 'recent_hours' not in config.get('maven', {}):
+        config['maven']['recent_hours'] = 48
+        save_config(paths.config_file, config)
+
     # Load modules (auto-download on demand for init command, but not in non-interactive mode)
     if phase1_args.command == 'init':
         auto_download = not phase1_args.no_interactive
@@ -6528,7 +7536,7 @@ def main():
             full_parser = DynamicCLIBuilder.add_template_arguments(full_parser, metadata)
 
     # Parse all arguments
-    args = full_parser.parse_args()
+    args = DynamicCLIBuilder.parse_args(full_parser)
 
     # Route to command handlers
     if not args.command:
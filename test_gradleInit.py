@@ -14,11 +14,14 @@ Usage:
     python -m pytest test_gradleInit_comprehensive.py -v
 """
 
+import io
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 import sys
 import time
@@ -1027,11 +1030,15 @@ class TestDependenciesAndCache(unittest.TestCase):
         stale = paths.compiled_templates / 'ktor' / 'build.gradle.kts'
         stale.parent.mkdir(parents=True, exist_ok=True)
         stale.write_text('stale', encoding='utf-8')
+        stale_bytecode = paths.cache_dir / 'jinja' / '__jinja2_0123.cache'
+        stale_bytecode.parent.mkdir(parents=True, exist_ok=True)
+        stale_bytecode.write_bytes(b'stale')
         (paths.cache_dir / '.tool_version').write_text('0.0.0', encoding='utf-8')
 
         paths2 = self._paths(base)
         paths2.ensure_structure()
         self.assertFalse(stale.exists(), 'stale compiled cache was not cleared')
+        self.assertFalse(stale_bytecode.exists(), 'stale bytecode cache was not cleared')
         self.assertTrue(paths2.cache_rebuilt)
         self.assertEqual(
             (paths2.cache_dir / '.tool_version').read_text(encoding='utf-8').strip(),
@@ -1045,6 +1052,17 @@ class TestDependenciesAndCache(unittest.TestCase):
         paths2.ensure_structure()
         self.assertFalse(paths2.cache_rebuilt)
 
+    def test_default_config_created_on_first_read(self):
+        base = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, base, ignore_errors=True)
+        paths = self._paths(base)
+        with redirect_stdout(io.StringIO()):
+            paths.ensure_structure(create_config=False)
+            self.assertFalse(paths.config_file.exists())
+            config = paths.get_config()
+        self.assertTrue(paths.config_file.exists())
+        self.assertIn('templates', config)
+
 class TestVersionsForceLatest(unittest.TestCase):
     """versions --latest must force literal entries to newest and never touch
     templated placeholder values ({{ ... }})."""
@@ -1152,6 +1170,11 @@ class TestLineEndings(unittest.TestCase):
         gradleInit.write_text_lf(f, 'a\r\nb\rc\nd')
         self.assertEqual(f.read_bytes(), b'a\nb\nc\nd')
 
+    def test_write_chunks_lf_normalizes_across_chunks(self):
+        f = self._tmp() / 'out.txt'
+        gradleInit.write_chunks_lf(f, ['a\r', '\nb\r', 'c', '', 'd\r'])
+        self.assertEqual(f.read_bytes(), b'a\nb\ncd\n')
+
     def test_update_version_keeps_lf(self):
         f = self._tmp() / 'libs.versions.toml'
         f.write_bytes(b'[versions]\n'
@@ -1172,6 +1195,16 @@ class TestLineEndings(unittest.TestCase):
         self.assertNotIn(b'\r', data)
         self.assertIn(b'ktor = "3.5.1"', data)
 
+    def test_copy_file_fast_keeps_bytes_and_mode(self):
+        d = self._tmp()
+        src, dst = d / 'run.sh.raw', d / 'run.sh'
+        src.write_bytes(b'#!/bin/sh\r\necho ${X}\n' + bytes(range(256)))
+        os.chmod(src, 0o755)
+        gradleInit.copy_file_fast(src, dst)
+        self.assertEqual(dst.read_bytes(), src.read_bytes())
+        self.assertEqual(os.stat(dst).st_mode & 0o777, 0o755)
+        self.assertEqual(os.stat(dst).st_mtime_ns, os.stat(src).st_mtime_ns)
+
     def test_no_raw_write_text_in_source(self):
         # Guard: every text write must go through write_text_lf (the .cmd shim
         # writes bytes explicitly and is exempt).
@@ -1492,6 +1525,346 @@ class TestSelfUpdateGitInteractive(unittest.TestCase):
         self.assertIn('Permission denied (publickey)', out)
 
 
+class TestContextBuilderEnv(unittest.TestCase):
+    """GRADLE_INIT_* variables feed the context with typed values; other
+    environment variables are ignored."""
+
+    class _Meta:
+        def get_arguments(self):
+            return []
+
+    def _context(self, env, cli=None):
+        return ContextBuilder(config={}, env_vars=env, cli_args=cli or {},
+                              template_metadata=self._Meta()).build_context()
+
+    def test_prefix_filter_and_lowercase(self):
+        ctx = self._context({'GRADLE_INIT_AUTHOR': 'Jane', 'HOME': '/home/x'})
+        self.assertEqual(ctx['author'], 'Jane')
+        self.assertNotIn('home', ctx)
+
+    def test_parse_env_value_types(self):
+        parse = ContextBuilder._parse_env_value
+        self.assertIs(parse('TRUE'), True)
+        self.assertIs(parse('no'), False)
+        self.assertIs(parse('1'), True)
+        self.assertEqual(parse('-42'), -42)
+        self.assertEqual(parse('a, b,c'), ['a', 'b', 'c'])
+        self.assertEqual(parse('1.5'), '1.5')
+        self.assertEqual(parse('12abc'), '12abc')
+        for padded, number in ((' 17', 17), ('21\n', 21), ('+5', 5), ('1_000', 1000)):
+            self.assertEqual(parse(padded), number)
+            self.assertIs(type(parse(padded)), int)
+
+    def test_cli_overrides_env(self):
+        ctx = self._context({'GRADLE_INIT_GROUP': 'com.env'}, {'group': 'com.cli'})
+        self.assertEqual(ctx['group'], 'com.cli')
+
+
+class TestJinja2Environment(unittest.TestCase):
+    """setup_jinja2_environment reuses one base environment but keeps the
+    loader and the config() global per call."""
+
+    def test_config_global_is_per_call(self):
+        with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+            env_a = gradleInit.setup_jinja2_environment(Path(a), {'custom': {'author': 'A'}})
+            env_b = gradleInit.setup_jinja2_environment(Path(b), {'custom': {'author': 'B'}})
+            tmpl = "{{ config('custom.author') }} {{ 'my_app' | PascalCase }}"
+            self.assertEqual(env_a.from_string(tmpl).render(), 'A MyApp')
+            self.assertEqual(env_b.from_string(tmpl).render(), 'B MyApp')
+
+    def test_loader_is_per_call(self):
+        with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+            (Path(a) / 'x.txt').write_bytes(b'from a')
+            (Path(b) / 'x.txt').write_bytes(b'from b')
+            env_a = gradleInit.setup_jinja2_environment(Path(a))
+            env_b = gradleInit.setup_jinja2_environment(Path(b))
+            self.assertEqual(env_a.get_template('x.txt').render(), 'from a')
+            self.assertEqual(env_b.get_template('x.txt').render(), 'from b')
+
+    def test_bytecode_cache_serves_string_templates(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / 'jinja'
+            for _ in range(2):
+                gen = gradleInit.ProjectGenerator(
+                    Path(tmp), {'name': 'demo'}, Path(tmp) / 'out',
+                    jinja_cache_dir=cache_dir)
+                tmpl = gen._template_from_string('Hi {{ name | PascalCase }}', 'a.txt')
+                self.assertEqual(tmpl.render(name='my_app'), 'Hi MyApp')
+            self.assertEqual(len(list(cache_dir.iterdir())), 1)
+
+    def test_bytecode_cache_keyed_by_source_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / 'jinja'
+            gen = gradleInit.ProjectGenerator(
+                Path(tmp), {'name': 'demo'}, Path(tmp) / 'out',
+                jinja_cache_dir=cache_dir)
+            for template in ('a', 'b'):
+                source = str(Path(tmp) / template / 'build.gradle.kts')
+                tmpl = gen._template_from_string('{{ name }}-' + template,
+                                                 'build.gradle.kts', source)
+                self.assertEqual(tmpl.render(name='x'), 'x-' + template)
+            self.assertEqual(len(list(cache_dir.iterdir())), 2)
+
+
+class TestBatchedTemplateArguments(unittest.TestCase):
+    """Templates with many arguments are parsed in one pass by
+    DynamicCLIBuilder.parse_args instead of one argparse action each."""
+
+    def _parser(self, count):
+        class _Meta:
+            def get_name(self):
+                return 'big'
+
+            def get_arguments(self):
+                args = [gradleInit.TemplateArgument(f'opt{i}', 'string', '', f'opt{i}')
+                        for i in range(count)]
+                args.append(gradleInit.TemplateArgument('flag', 'boolean', '', 'flag'))
+                args.append(gradleInit.TemplateArgument('level', 'integer', '', 'level'))
+                return args
+
+        parser = gradleInit.DynamicCLIBuilder.create_base_parser()
+        return gradleInit.DynamicCLIBuilder.add_template_arguments(parser, _Meta())
+
+    def test_batched_matches_argparse(self):
+        argv = ['init', '--opt1', 'a', 'myapp', '--opt3=b', '--flag', '--level', '7']
+        for count in (5, 30):
+            args = gradleInit.DynamicCLIBuilder.parse_args(self._parser(count), argv)
+            self.assertEqual(args.project_name, 'myapp')
+            self.assertEqual((args.opt1, args.opt3, args.opt2), ('a', 'b', None))
+            self.assertIs(args.flag, True)
+            self.assertEqual(args.level, 7)
+
+    def test_batched_rejects_bad_int(self):
+        parser = self._parser(30)
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            gradleInit.DynamicCLIBuilder.parse_args(parser, ['init', '--level', 'x'])
+
+
+class TestTemplateRepositoryListing(unittest.TestCase):
+    """list_templates finds TEMPLATE.md or *.j2 directories and refreshes
+    its cached listing when the repository directory changes."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        for rel in ('a/TEMPLATE.md', 'b/build.gradle.kts.j2', 'c/readme.txt',
+                    '.hidden/TEMPLATE.md'):
+            target = self.root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(b'x')
+
+    def test_lists_template_directories(self):
+        repo = gradleInit.TemplateRepository('test', self.root)
+        self.assertEqual(repo.list_templates(), ['a', 'b'])
+        self.assertEqual(repo.list_templates_with_paths(),
+                         [('a', self.root / 'a'), ('b', self.root / 'b')])
+
+    def test_listing_refreshes_after_change(self):
+        repo = gradleInit.TemplateRepository('test', self.root)
+        self.assertEqual(repo.list_templates(), ['a', 'b'])
+        (self.root / 'd').mkdir()
+        (self.root / 'd' / 'TEMPLATE.md').write_bytes(b'x')
+        # Make sure the directory mtime moves even on coarse-grained clocks
+        st = os.stat(self.root)
+        os.utime(self.root, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(repo.list_templates(), ['a', 'b', 'd'])
+
+
+class TestTemplateHintScanning(unittest.TestCase):
+    """Template files are found in one walk (excluded directories pruned,
+    every file listed once) and scanned for hints with correct line numbers."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        files = {
+            'build.gradle.kts': 'group = "{{ @@01|Group=com.example@@group }}"\n'
+                                'name = "{{ project_name }}"\n',
+            'gradle/libs.versions.toml': 'jdk = "{{ @@03|(17|21)|JDK=21@@jdk_version }}"\n',
+            'gradle/wrapper/gradle-wrapper.properties': 'x={{ wrapper_var }}\n',
+            'build/out.txt': '{{ build_var }}\n',
+        }
+        for rel, content in files.items():
+            target = self.root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content.encode('utf-8'))
+
+    def test_find_template_files(self):
+        parser = gradleInit.TemplateHintParser(self.root)
+        found = [f.relative_to(self.root).as_posix() for f in parser._find_template_files()]
+        self.assertEqual(found, ['build.gradle.kts', 'gradle/libs.versions.toml'])
+
+    def test_parse_templates(self):
+        variables = gradleInit.TemplateHintParser(self.root).parse_templates()
+        self.assertEqual(sorted(variables), ['group', 'jdk_version', 'project_name'])
+        self.assertEqual(variables['group'].default_value, 'com.example')
+        self.assertEqual(variables['jdk_version'].regex_pattern, '17|21')
+        self.assertEqual(variables['project_name'].locations,
+                         [(self.root / 'build.gradle.kts', 2)])
+
+    def test_compiled_content_stats_source_once(self):
+        from unittest import mock
+        source = self.root / 'build.gradle.kts'
+        metadata = gradleInit.TemplateMetadata(self.root, self.root / 'cache')
+        with mock.patch('os.stat', wraps=os.stat) as stat_mock:
+            content = metadata.get_compiled_content(source)
+        self.assertIn('{{ group }}', content)
+        source_stats = [c for c in stat_mock.call_args_list if c.args[0] == source]
+        self.assertEqual(source_stats, [mock.call(source)])
+
+    def test_no_nested_pool_on_worker_thread(self):
+        from unittest import mock
+        for i in range(gradleInit.TemplateHintParser.PARALLEL_MIN_FILES):
+            (self.root / f'f{i}.txt').write_bytes(f'{{{{ var{i} }}}}\n'.encode('ascii'))
+        with mock.patch.object(gradleInit, 'ThreadPoolExecutor', side_effect=AssertionError):
+            results = []
+            worker = threading.Thread(
+                target=lambda: results.append(
+                    gradleInit.TemplateHintParser(self.root).parse_templates()))
+            worker.start()
+            worker.join()
+        self.assertEqual(len(results), 1)
+        self.assertIn('var0', results[0])
+
+    def test_hints_do_not_span_lines(self):
+        cases = {
+            'x = "{{ @@01|\n{{ y }} text@@v }}"\n': ('y', 2),
+            'a {{ @@Help\n}} {{ z }}@@q }}\n': ('z', 2),
+            'a {{ @@Help {{ w }}@@q }}\n': ('w', 1),
+            'a\r\nb\rc {{ @@H\r}} {{ u }}@@q }}\n': ('u', 4),
+        }
+        for content, (name, line) in cases.items():
+            path = self.root / 'hint.txt'
+            path.write_bytes(content.encode('utf-8'))
+            parser = gradleInit.TemplateHintParser(self.root)
+            parser._parse_file(path)
+            self.assertEqual([(n, v.locations) for n, v in parser.variables.items()
+                              if not v.is_enhanced], [(name, [(path, line)])], content)
+
+
+class TestTreeRemoval(unittest.TestCase):
+    """remove_tree_in_background frees the name at once; remove_stale_trash
+    sweeps what an interrupted background delete left behind."""
+
+    def test_background_removal_and_sweep(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        target = root / 'repo_temp'
+        (target / 'sub').mkdir(parents=True)
+        (target / 'sub' / 'f.txt').write_bytes(b'x')
+        gradleInit.remove_tree_in_background(target)
+        self.assertFalse(target.exists())
+
+        (root / 'repo_temp.trash-dead').mkdir()
+        (root / 'other').mkdir()
+        gradleInit.remove_stale_trash(target)
+        names = [p.name for p in root.iterdir()]
+        self.assertEqual([n for n in names if n.startswith('repo_temp.trash-')], [])
+        self.assertIn('other', names)
+
+    def test_delete_finishes_before_interpreter_exit(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        target = root / 'repo_temp'
+        for i in range(50):
+            (target / str(i)).mkdir(parents=True)
+            for j in range(20):
+                (target / str(i) / f'{j}.txt').write_bytes(b'x')
+        script = ("import sys; from pathlib import Path; sys.path.insert(0, sys.argv[1]); "
+                  "import gradleInit; gradleInit.remove_tree_in_background(Path(sys.argv[2]))")
+        subprocess.run([sys.executable, '-c', script,
+                        str(Path(gradleInit.__file__).parent), str(target)], check=True)
+        self.assertEqual(list(root.iterdir()), [])
+
+
+class TestUnknownExtensionFiles(unittest.TestCase):
+    """Files with an unknown extension are copied byte-for-byte, never
+    rendered; every generated file keeps the source permissions."""
+
+    def test_unknown_extension_copied_verbatim_with_mode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / 'tpl'
+            (src / 'web').mkdir(parents=True)
+            (src / 'scripts').mkdir()
+            (src / 'web' / 'page.mustache').write_bytes(b'<p>{{ title }}</p>\n')
+            tool = src / 'scripts' / 'tool.py'
+            tool.write_bytes(b'print("hi")\r\n')
+            tool.chmod(0o755)
+            (src / 'scripts' / 'run.cmd').write_bytes(b'@echo off\r\necho {{ name }}\r\n')
+            run = src / 'scripts' / 'run.sh'
+            run.write_bytes(b'echo {{ name }}\n')
+            run.chmod(0o755)
+            out = Path(tmp) / 'out'
+            out.mkdir()
+            gen = gradleInit.ProjectGenerator(src, {'name': 'demo'}, out)
+            with redirect_stdout(io.StringIO()):
+                gen._process_directory(src, out)
+            self.assertEqual((out / 'web' / 'page.mustache').read_bytes(), b'<p>{{ title }}</p>\n')
+            self.assertEqual((out / 'scripts' / 'tool.py').read_bytes(), b'print("hi")\r\n')
+            self.assertEqual((out / 'scripts' / 'run.cmd').read_bytes(),
+                             b'@echo off\r\necho {{ name }}\r\n')
+            self.assertEqual((out / 'scripts' / 'run.sh').read_bytes(), b'echo demo\n')
+            if not sys.platform.startswith('win'):
+                for name in ('tool.py', 'run.sh'):
+                    mode = (out / 'scripts' / name).stat().st_mode & 0o777
+                    self.assertEqual(mode, 0o755)
+
+
+class TestRenderFailureLeavesNoFile(unittest.TestCase):
+    """A render that fails partway (StrictUndefined) writes no target file."""
+
+    def test_undefined_variable_removes_partial_output(self):
+        import jinja2
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / 'tpl'
+            src.mkdir()
+            (src / 'README.md').write_bytes(b'# {{ name }}\n' + b'x' * (1 << 17) + b'{{ missing }}\n')
+            out = Path(tmp) / 'out'
+            out.mkdir()
+            gen = gradleInit.ProjectGenerator(src, {'name': 'demo'}, out)
+            with redirect_stdout(io.StringIO()), self.assertRaises(jinja2.UndefinedError):
+                gen._render_text_file(src / 'README.md', out / 'README.md')
+            self.assertFalse((out / 'README.md').exists())
+
+
+class TestUrlTemplateCache(unittest.TestCase):
+    """URL templates cached under the old MD5-based name are adopted, not
+    cloned again."""
+
+    def test_legacy_md5_cache_is_renamed(self):
+        import hashlib
+        base = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, base, ignore_errors=True)
+        paths = gradleInit.GradleInitPaths(base_dir=base / '.gradleInit')
+        paths.ensure_structure(create_config=False)
+        url = 'https://example.invalid/org/template.git'
+        legacy = paths.cache_dir / hashlib.md5(url.encode()).hexdigest()[:12]
+        legacy.mkdir()
+        (legacy / 'TEMPLATE.md').write_bytes(b'# T\n')
+        manager = gradleInit.TemplateRepositoryManager(paths)
+        with redirect_stdout(io.StringIO()):
+            found = manager._handle_template_url(url)
+        self.assertEqual(found.name, hashlib.sha256(url.encode()).hexdigest()[:12])
+        self.assertTrue((found / 'TEMPLATE.md').exists())
+        self.assertFalse(legacy.exists())
+
+
+class TestCaseConversion(unittest.TestCase):
+    """The case filters split words in a single regex pass each."""
+
+    def test_acronyms_and_digits(self):
+        cases = {
+            'HTTPResponse': ('httpResponse', 'http_response', 'http-response'),
+            'XMLHTTPRequest': ('xmlhttpRequest', 'xmlhttp_request', 'xmlhttp-request'),
+            'VP9Codec': ('vp9Codec', 'vp9_codec', 'vp9-codec'),
+            'my-app name': ('myAppName', 'my_app_name', 'my-app-name'),
+        }
+        for source, (camel, snake, kebab) in cases.items():
+            self.assertEqual(gradleInit._to_camel_case(source), camel)
+            self.assertEqual(gradleInit._to_snake_case(source), snake)
+            self.assertEqual(gradleInit._to_kebab_case(source), kebab)
+
+
 # ============================================================================
 # Test Runner
 # ============================================================================
@@ -99,6 +99,70 @@ class TestFilterGradleVersions(unittest.TestCase):
         self.assertIn("9.6.0-rc-1", out)
 
 
+class TestGradleVersionsCache(unittest.TestCase):
+    def test_fresh_cache_skips_network(self):
+        import tempfile
+        import urllib.request
+        from unittest import mock
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Path(tmp) / "gradle-versions.json"
+            cache.write_bytes(b'[{"version": "9.5.1"}]')
+            with mock.patch.object(urllib.request, "urlopen", side_effect=AssertionError):
+                raw = gradleInit._read_gradle_versions_json(cache)
+        self.assertEqual(raw, b'[{"version": "9.5.1"}]')
+
+    def test_stale_cache_used_when_offline(self):
+        import os
+        import tempfile
+        import urllib.request
+        from unittest import mock
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Path(tmp) / "gradle-versions.json"
+            cache.write_bytes(b'[]')
+            old = cache.stat().st_mtime - 2 * gradleInit.GRADLE_VERSIONS_CACHE_TTL
+            os.utime(cache, (old, old))
+            with mock.patch.object(urllib.request, "urlopen", side_effect=OSError("offline")):
+                self.assertEqual(gradleInit._read_gradle_versions_json(cache), b'[]')
+
+    def test_stale_cache_used_on_server_error(self):
+        import os
+        import tempfile
+        import urllib.error
+        import urllib.request
+        from unittest import mock
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Path(tmp) / "gradle-versions.json"
+            cache.write_bytes(b'[]')
+            old = cache.stat().st_mtime - 2 * gradleInit.GRADLE_VERSIONS_CACHE_TTL
+            os.utime(cache, (old, old))
+            error = urllib.error.HTTPError(gradleInit.GRADLE_VERSIONS_URL, 503,
+                                           "Service Unavailable", {}, None)
+            with mock.patch.object(urllib.request, "urlopen", side_effect=error):
+                self.assertEqual(gradleInit._read_gradle_versions_json(cache), b'[]')
+            # Still stale, so the next run retries
+            self.assertLess(cache.stat().st_mtime, old + 1)
+
+
+    def test_corrupt_cache_is_refetched(self):
+        import io
+        import tempfile
+        import types
+        import urllib.request
+        from unittest import mock
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Path(tmp) / "gradle-versions.json"
+            cache.write_bytes(b'[{"version": "9.5')  # truncated, but fresh
+            body = b'[{"version": "9.5.1", "snapshot": false, "nightly": false}]'
+            paths = types.SimpleNamespace(cache_dir=Path(tmp))
+            with mock.patch.object(gradleInit, "GradleInitPaths", return_value=paths), \
+                    mock.patch.object(urllib.request, "urlopen",
+                                      return_value=io.BytesIO(body)):
+                self.assertEqual(gradleInit.fetch_gradle_versions(), ["9.5.1"])
+            self.assertEqual(cache.read_bytes(), body)
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()),
+                             ["gradle-versions.json"])
+
+
 class TestSelectTarget(unittest.TestCase):
     AVAILABLE = ["8.14", "9.3.1", "9.4.1", "9.5.1", "10.0.0"]
 